@@ -166,16 +166,56 @@ def extract_audio(video_path: Path, audio_wav: Path) -> None:
     )
 
 
+FRAME_EXTRACTORS = ("image2", "pipe-mjpeg")
+
+
+def iter_mjpeg_frames(stream: Any, *, chunk_size: int = 1 << 16) -> Iterable[memoryview]:
+    # Split a concatenated MJPEG byte stream on SOI (FFD8) / EOI (FFD9) markers.
+    # Entropy-coded data byte-stuffs 0xFF, so FFD9 only appears as a real EOI.
+    # Frames are zero-copy views into the read buffer, valid until the next iteration.
+    buf = bytearray()
+    chunk = bytearray(chunk_size)
+    scan = 0  # where the EOI search of a still-incomplete frame resumes
+    while True:
+        n = stream.readinto(chunk)
+        if not n:
+            return
+        buf += memoryview(chunk)[:n]
+        pos = 0
+        while True:
+            soi = buf.find(b"\xff\xd8", pos)
+            if soi < 0:
+                # keep the last byte: it may be the 0xFF half of the next SOI
+                pos = max(pos, len(buf) - 1)
+                break
+            eoi = buf.find(b"\xff\xd9", max(soi + 2, scan))
+            if eoi < 0:
+                pos = soi
+                # next read rescans only the new bytes (plus a possible trailing 0xFF)
+                scan = len(buf) - 1
+                break
+            with memoryview(buf) as view, view[soi : eoi + 2] as frame:
+                yield frame
+            pos = eoi + 2
+            scan = 0
+        # one compaction per read instead of one per frame
+        del buf[:pos]
+        scan = max(scan - pos, 0)
+
+
 def extract_frames(
     video_path: Path,
     frames_dir: Path,
     *,
     frame_every_sec: float,
     max_height: int,
+    extractor: str = "image2",
 ) -> None:
     frames_dir.mkdir(parents=True, exist_ok=True)
     if frame_every_sec <= 0:
         raise ValueError("frame_every_sec must be > 0")
+    if extractor not in FRAME_EXTRACTORS:
+        raise ValueError(f"unsupported frame extractor: {extractor!r}")
 
     vf_parts: List[str] = []
     if max_height and max_height > 0:
@@ -184,6 +224,33 @@ def extract_frames(
     vf_parts.append(f"fps=1/{frame_every_sec}")
     vf = ",".join(vf_parts)
 
+    if extractor == "pipe-mjpeg":
+        # Same single ffmpeg pass, but frames come back over stdout for the caller to split.
+        cmd = [
+            "ffmpeg",
+            "-i",
+            str(video_path),
+            "-vf",
+            vf,
+            "-f",
+            "image2pipe",
+            "-vcodec",
+            "mjpeg",
+            "-q:v",
+            "2",
+            "-loglevel",
+            "error",
+            "pipe:1",
+        ]
+        logger.info("run: %s", cmd)
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE) as proc:
+            assert proc.stdout is not None
+            for idx, frame in enumerate(iter_mjpeg_frames(proc.stdout), start=1):
+                (frames_dir / f"{idx:06d}.jpg").write_bytes(frame)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        return
+
     run(
         [
             "ffmpeg",
@@ -594,6 +661,8 @@ def analyze_video(
     asr_device: str = "auto",
     asr_compute_type: str = "auto",
     asr_vad_filter: bool = True,
+    probe_meta: Optional[Dict[str, Any]] = None,
+    frame_extractor: str = "image2",
 ) -> Dict[str, Any]:
     ensure_ffmpeg()
 
@@ -614,7 +683,10 @@ def analyze_video(
     key_metrics_csv = out_dir / "key_metrics.csv"
 
     warnings: List[str] = []
-    duration_sec = ffprobe_duration_sec(video_path)
+    # Callers that already probed the file (video_pipeline_run) pass the result in.
+    duration_sec = (probe_meta or {}).get("duration_sec")
+    if duration_sec is None:
+        duration_sec = ffprobe_duration_sec(video_path)
     video_sha = sha256_file(video_path)
 
     if dry_run:
@@ -673,6 +745,7 @@ def analyze_video(
                 frames_dir,
                 frame_every_sec=frame_every_sec,
                 max_height=max_height,
+                extractor=frame_extractor,
             )
         frame_files = sorted(frames_dir.glob("*.jpg"))
         for idx, fp in enumerate(frame_files, start=1):
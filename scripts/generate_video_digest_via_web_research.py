@@ -697,36 +697,29 @@ def _build_gemini_audit_prompt(*, digest_md: str) -> str:
     )
 
 
-def main(argv: List[str]) -> int:
-    ap = argparse.ArgumentParser(description="Generate a video digest via chatgptMCP (ChatGPT Pro + Gemini web).")
-    ap.add_argument("--analysis-id", default="", help="state/video-analyses/<analysis_id>")
-    ap.add_argument("--analysis-dir", default="", help="Explicit analysis directory path.")
-    ap.add_argument("--topic", default="", help="Optional topic_id to write into archives/topics/<topic>/digests/")
-    ap.add_argument("--output", default="", help="Optional explicit output path for digest markdown.")
-    ap.add_argument("--published-at", default="", help="Optional published_at (YYYY-MM-DD) to force into frontmatter.")
-    ap.add_argument("--source-url", default="", help="Optional source_url override (e.g. bilibili video URL).")
-    ap.add_argument("--max-transcript-chars", type=int, default=20000, help="Max chars of transcript to include in prompt (0=all).")
-    ap.add_argument("--no-ocr", action="store_true", help="Do not include OCR hits in prompt.")
-    ap.add_argument("--no-gemini", action="store_true", help="Skip Gemini audit step.")
-    ap.add_argument("--timeout-seconds", type=int, default=1200, help="Timeout for each web ask (seconds).")
-    ap.add_argument("--chatgpt-mcp-url", default="", help="MCP HTTP url (default from env CHATGPT_MCP_URL or http://127.0.0.1:18701/mcp).")
-    ap.add_argument("--allow-invalid", action="store_true", help="Write model output even if it fails template validation (not recommended).")
-    ap.add_argument("--json", action="store_true", help="Output a JSON object (paths + conversation urls) instead of plain path.")
-    ap.add_argument("--dry-run", action="store_true", help="Build prompts and print planned paths without calling MCP.")
-    args = ap.parse_args(argv)
-
-    analysis_dir = Path(args.analysis_dir).expanduser() if args.analysis_dir else None
-    if analysis_dir is None:
-        analysis_id = str(args.analysis_id).strip()
-        if not analysis_id:
-            _die("require --analysis-id or --analysis-dir")
-        analysis_dir = REPO_ROOT / "state" / "video-analyses" / analysis_id
-    if not analysis_dir.exists():
-        _die(f"analysis_dir not found: {analysis_dir}")
+def run_digest(
+    *,
+    analysis_dir: Path,
+    topic_id: str = "",
+    output: str | Path = "",
+    published_at: str = "",
+    source_url: str = "",
+    max_transcript_chars: int = 20000,
+    include_ocr: bool = True,
+    no_gemini: bool = False,
+    timeout_seconds: int = 1200,
+    chatgpt_mcp_url: str = "",
+    allow_invalid: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Generate one digest in-process and return the `--json` payload.
 
-    topic_id = str(args.topic).strip()
-    if args.output:
-        out_path = Path(args.output).expanduser()
+    Failures raise RuntimeError (the CLI maps them to exit code 2), so batch callers such as
+    topic_video_handoff_rerun.py can call this per video without paying an interpreter start-up.
+    """
+    topic_id = (topic_id or "").strip()
+    if output:
+        out_path = Path(output).expanduser()
     else:
         date = datetime.now().strftime("%Y-%m-%d")
         stem = f"{date}_video_{analysis_dir.name}"
@@ -738,12 +731,12 @@ def main(argv: List[str]) -> int:
     out_path.parent.mkdir(parents=True, exist_ok=True)
     digest_stem = out_path.stem
 
-    published_at = str(args.published_at).strip()
+    published_at = (published_at or "").strip()
     meta, transcript_lines, ocr_and_compact = _build_inputs(
         analysis_dir,
-        max_transcript_chars=int(args.max_transcript_chars),
-        include_ocr=(not bool(args.no_ocr)),
-        source_url_override=str(args.source_url).strip(),
+        max_transcript_chars=int(max_transcript_chars),
+        include_ocr=bool(include_ocr),
+        source_url_override=(source_url or "").strip(),
     )
 
     prompt = _build_chatgpt_prompt(
@@ -755,17 +748,18 @@ def main(argv: List[str]) -> int:
         ocr_and_compact=ocr_and_compact,
     )
 
-    if args.dry_run:
-        print(f"[dry-run] analysis_dir={analysis_dir}")
-        print(f"[dry-run] output={out_path}")
-        print(f"[dry-run] prompt_chars={len(prompt)} transcript_lines={len(transcript_lines)}")
-        return 0
+    if dry_run:
+        return {
+            "ok": True,
+            "dry_run": True,
+            "analysis_dir": str(analysis_dir),
+            "digest_path": str(out_path),
+            "prompt_chars": len(prompt),
+            "transcript_lines": len(transcript_lines),
+        }
 
-    url = str(args.chatgpt_mcp_url).strip() or os.environ.get("CHATGPT_MCP_URL") or "http://127.0.0.1:18701/mcp"
-    try:
-        session = _mcp_initialize_with_retry(url, attempts=3)
-    except Exception as exc:
-        _die(str(exc))
+    url = (chatgpt_mcp_url or "").strip() or os.environ.get("CHATGPT_MCP_URL") or "http://127.0.0.1:18701/mcp"
+    session = _mcp_initialize_with_retry(url, attempts=3)
 
     # ChatGPT Pro (main digest)
     chatgpt_result: Dict[str, Any] = {}
@@ -774,12 +768,12 @@ def main(argv: List[str]) -> int:
             session,
             url=url,
             tool_name="chatgpt_web_ask_pro_extended",
-            tool_args={"question": prompt, "timeout_seconds": int(args.timeout_seconds)},
-            timeout_seconds=int(args.timeout_seconds),
+            tool_args={"question": prompt, "timeout_seconds": int(timeout_seconds)},
+            timeout_seconds=int(timeout_seconds),
             attempts=3,
         )
     except Exception as exc:
-        _die(str(exc))
+        raise RuntimeError(str(exc)) from exc
 
     answer = str(chatgpt_result.get("answer") or "")
     digest_md = _sanitize_llm_markdown(answer)
@@ -836,8 +830,8 @@ entities: []
             chatgpt_result2 = mcp_http_call_tool(
                 session,
                 tool_name="chatgpt_web_ask_pro_extended",
-                tool_args={"question": repair, "conversation_url": conv, "timeout_seconds": int(args.timeout_seconds)},
-                timeout_sec=float(args.timeout_seconds) + 30.0,
+                tool_args={"question": repair, "conversation_url": conv, "timeout_seconds": int(timeout_seconds)},
+                timeout_sec=float(timeout_seconds) + 30.0,
             )
             digest_md2 = _sanitize_llm_markdown(str(chatgpt_result2.get("answer") or ""))
             digest_md2 = _normalize_chatgpt_output(
@@ -855,12 +849,12 @@ entities: []
             pass
 
     final_errs = _validate_digest(digest_md)
-    if final_errs and not bool(args.allow_invalid):
+    if final_errs and not allow_invalid:
         debug_dir = REPO_ROOT / "state" / "tmp" / "video_digest_web_research"
         debug_dir.mkdir(parents=True, exist_ok=True)
         raw_path = debug_dir / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{analysis_dir.name}_raw.md"
         raw_path.write_text(digest_md, encoding="utf-8")
-        _die(
+        raise RuntimeError(
             "chatgpt output failed validation; wrote raw output to "
             f"{raw_path}. errors={final_errs}. You can re-run with --allow-invalid to force write."
         )
@@ -868,7 +862,7 @@ entities: []
     # Optional Gemini audit (append to digest as a handoff section).
     audit_md = ""
     gemini_result: Dict[str, Any] = {}
-    if not bool(args.no_gemini):
+    if not no_gemini:
         # Be conservative: wait a bit before asking Gemini to reduce "back-to-back" UI actions.
         time.sleep(10)
         try:
@@ -876,8 +870,8 @@ entities: []
                 session,
                 url=url,
                 tool_name="gemini_web_ask_pro_thinking",
-                tool_args={"question": _build_gemini_audit_prompt(digest_md=digest_md), "timeout_seconds": int(args.timeout_seconds)},
-                timeout_seconds=int(args.timeout_seconds),
+                tool_args={"question": _build_gemini_audit_prompt(digest_md=digest_md), "timeout_seconds": int(timeout_seconds)},
+                timeout_seconds=int(timeout_seconds),
                 attempts=2,
             )
             audit_text = str(gemini_result.get("answer") or "").strip()
@@ -926,21 +920,74 @@ entities: []
         note_lines.append("")
         note_path.write_text("\n".join(note_lines), encoding="utf-8")
 
+    payload: Dict[str, Any] = {
+        "ok": True,
+        "analysis_dir": str(analysis_dir),
+        "digest_path": str(out_path),
+        "topic_id": topic_id,
+        "published_at": published_at,
+        "chatgpt_conversation_url": str(chatgpt_result.get("conversation_url") or ""),
+        "gemini_conversation_url": str(gemini_result.get("conversation_url") or ""),
+    }
+    if note_path is not None:
+        payload["run_note_path"] = str(note_path)
+    return payload
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Generate a video digest via chatgptMCP (ChatGPT Pro + Gemini web).")
+    ap.add_argument("--analysis-id", default="", help="state/video-analyses/<analysis_id>")
+    ap.add_argument("--analysis-dir", default="", help="Explicit analysis directory path.")
+    ap.add_argument("--topic", default="", help="Optional topic_id to write into archives/topics/<topic>/digests/")
+    ap.add_argument("--output", default="", help="Optional explicit output path for digest markdown.")
+    ap.add_argument("--published-at", default="", help="Optional published_at (YYYY-MM-DD) to force into frontmatter.")
+    ap.add_argument("--source-url", default="", help="Optional source_url override (e.g. bilibili video URL).")
+    ap.add_argument("--max-transcript-chars", type=int, default=20000, help="Max chars of transcript to include in prompt (0=all).")
+    ap.add_argument("--no-ocr", action="store_true", help="Do not include OCR hits in prompt.")
+    ap.add_argument("--no-gemini", action="store_true", help="Skip Gemini audit step.")
+    ap.add_argument("--timeout-seconds", type=int, default=1200, help="Timeout for each web ask (seconds).")
+    ap.add_argument("--chatgpt-mcp-url", default="", help="MCP HTTP url (default from env CHATGPT_MCP_URL or http://127.0.0.1:18701/mcp).")
+    ap.add_argument("--allow-invalid", action="store_true", help="Write model output even if it fails template validation (not recommended).")
+    ap.add_argument("--json", action="store_true", help="Output a JSON object (paths + conversation urls) instead of plain path.")
+    ap.add_argument("--dry-run", action="store_true", help="Build prompts and print planned paths without calling MCP.")
+    args = ap.parse_args(argv)
+
+    analysis_dir = Path(args.analysis_dir).expanduser() if args.analysis_dir else None
+    if analysis_dir is None:
+        analysis_id = str(args.analysis_id).strip()
+        if not analysis_id:
+            _die("require --analysis-id or --analysis-dir")
+        analysis_dir = REPO_ROOT / "state" / "video-analyses" / analysis_id
+    if not analysis_dir.exists():
+        _die(f"analysis_dir not found: {analysis_dir}")
+
+    try:
+        payload = run_digest(
+            analysis_dir=analysis_dir,
+            topic_id=str(args.topic),
+            output=str(args.output),
+            published_at=str(args.published_at),
+            source_url=str(args.source_url),
+            max_transcript_chars=int(args.max_transcript_chars),
+            include_ocr=(not bool(args.no_ocr)),
+            no_gemini=bool(args.no_gemini),
+            timeout_seconds=int(args.timeout_seconds),
+            chatgpt_mcp_url=str(args.chatgpt_mcp_url),
+            allow_invalid=bool(args.allow_invalid),
+            dry_run=bool(args.dry_run),
+        )
+    except RuntimeError as exc:
+        _die(str(exc))
+
+    if payload.get("dry_run"):
+        print(f"[dry-run] analysis_dir={payload['analysis_dir']}")
+        print(f"[dry-run] output={payload['digest_path']}")
+        print(f"[dry-run] prompt_chars={payload['prompt_chars']} transcript_lines={payload['transcript_lines']}")
+        return 0
     if bool(args.json):
-        payload = {
-            "ok": True,
-            "analysis_dir": str(analysis_dir),
-            "digest_path": str(out_path),
-            "topic_id": topic_id,
-            "published_at": published_at,
-            "chatgpt_conversation_url": str(chatgpt_result.get("conversation_url") or ""),
-            "gemini_conversation_url": str(gemini_result.get("conversation_url") or ""),
-        }
-        if note_path is not None:
-            payload["run_note_path"] = str(note_path)
         sys.stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
     else:
-        sys.stdout.write(str(out_path) + "\n")
+        sys.stdout.write(str(payload["digest_path"]) + "\n")
     return 0
 
 
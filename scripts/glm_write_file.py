@@ -82,18 +82,18 @@ def _run_stdio_mcp_call(repo_root: Path, *, tool_name: str, tool_args: Dict[str,
         timeout=overall_timeout,
     )
 
-    # Parse JSON-RPC responses from stdout.
-    messages: List[Dict[str, Any]] = []
+    # Only the tools/call reply (id 2) matters: skip other frames unparsed and stop at the first match.
+    resp2: Dict[str, Any] | None = None
     for line in cp.stdout.splitlines():
-        line = line.strip()
-        if not line:
+        if '"id": 2' not in line and '"id":2' not in line:
             continue
         try:
-            messages.append(json.loads(line))
+            msg = json.loads(line)
         except Exception:
             continue
-
-    resp2 = next((m for m in messages if m.get("id") == 2), None)
+        if isinstance(msg, dict) and msg.get("id") == 2:
+            resp2 = msg
+            break
     if resp2 is None:
         raise SystemExit(f"Missing response for tool call. stderr={cp.stderr.strip()}")
     if "error" in resp2:
@@ -3,15 +3,60 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 
 _TOPIC_ID_RE = re.compile(r"^[a-z0-9_][a-z0-9_-]{0,63}$")
+# Bump when _validate_digest output changes so stale cache entries are ignored.
+_DIGEST_CACHE_VERSION = 2
+_SOURCES_PLACEHOLDER_ROW_RE = re.compile(r"\|\s*\|\s*\|\s*\|\s*\|\s*\|\s*\|")
+_CLAIM_LEDGER_HEADINGS = frozenset({"## Claim Ledger（断言清单，建议用于投研/行业研究）", "## Claim Ledger"})
+_CLAIM_LEDGER_HEADING_RE = re.compile(
+    r"^[^\S\n]*## Claim Ledger(?:（断言清单，建议用于投研/行业研究）)?[^\S\n]*$", re.MULTILINE
+)
+
+
+# Warnings are carried as (code, args) and only formatted when emitted: the interned code is shared across
+# every topic in an --all run instead of one fully formatted string per occurrence.
+WarningItem = tuple[str, tuple[str, ...]]
+_WARNING_TEMPLATES: dict[str, str] = {
+    sys.intern(code): template
+    for code, template in {
+        "sources_header_not_found": "sources.md: sources table header not found",
+        "sources_separator_not_found": "sources.md: sources table separator not found",
+        "sources_malformed_row": "sources.md: malformed row (expected 5 cols): {}",
+        "sources_empty_digest_cell": "sources.md: empty digest cell: {}",
+        "sources_duplicate_digest": "sources.md: duplicate digest entry: {}",
+        "sources_nonstandard_date": "sources.md: non-standard date '{}' (prefer YYYY-MM-DD or YYYY)",
+        "sources_unsorted": "sources.md: rows are not sorted by date (recommended: newest first)",
+        "timeline_unsorted": "timeline.md: entries are not sorted by date (recommended: oldest first)",
+        "digest_missing_topic_id": "digest missing topic_id frontmatter: {}",
+        "digest_missing_claim_ledger": "digest missing Claim Ledger section: {}",
+        "digest_claim_ledger_header_not_found": "digest Claim Ledger table header not found: {}",
+        "digest_claim_ledger_missing_claim": "digest Claim Ledger missing 'claim' column: {}",
+        "digest_claim_ledger_missing_claim_id": "digest Claim Ledger missing claim_id (recommended): {}",
+        "digest_duplicate_claim_id": "digest duplicate claim_id '{}': {}",
+        "overview_no_digest_refs": "overview.md: no digest references found (recommended to cite digests)",
+    }.items()
+}
+
+
+def _format_warning(item: WarningItem) -> str:
+    code, args = item
+    return _WARNING_TEMPLATES[code].format(*args)
 
 
 def _strip_quotes(value: str) -> str:
@@ -21,12 +66,10 @@ def _strip_quotes(value: str) -> str:
     return v
 
 
-def _parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
-    if not text.startswith("---\n"):
-        return {}, text
-    lines = text.splitlines(keepends=False)
-    if not lines or lines[0].strip() != "---":
-        return {}, text
+def _parse_frontmatter_lines(lines: list[str]) -> tuple[dict[str, Any], int]:
+    # Returns (frontmatter, body_start_idx); callers split the file once and slice the body from it.
+    if not lines or lines[0] != "---":
+        return {}, 0
 
     end = None
     for idx in range(1, len(lines)):
@@ -34,10 +77,9 @@ def _parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
             end = idx
             break
     if end is None:
-        return {}, text
+        return {}, 0
 
     fm_lines = lines[1:end]
-    rest = "\n".join(lines[end + 1 :]).lstrip("\n")
 
     fm: dict[str, Any] = {}
     for raw in fm_lines:
@@ -53,12 +95,12 @@ def _parse_frontmatter(text: str) -> tuple[dict[str, Any], str]:
         if value.lower() in {"null", "~"}:
             value = ""
         fm[key] = value
-    return fm, rest
+    return fm, end + 1
 
 
-def _is_table_row(line: str) -> bool:
-    s = line.strip()
-    return s.startswith("|") and s.endswith("|")
+def _is_table_row(s: str) -> bool:
+    # Expects an already-stripped line so hot loops strip each line only once.
+    return s[:1] == "|" and s[-1:] == "|"
 
 
 def _normalize_date_key(raw: str) -> str:
@@ -79,92 +121,119 @@ def _extract_digest_path(cell: str) -> str:
     return s
 
 
-@dataclass(frozen=True)
+def _scan_dir(path: Path) -> dict[str, os.DirEntry[str]]:
+    # One scandir per directory instead of a stat() per probed name.
+    try:
+        with os.scandir(path) as it:
+            return {e.name: e for e in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+# slots=True: one compact instance per topic; not frozen, since list/dict fields made the generated
+# __hash__ unusable anyway and frozen adds __setattr__ indirection at construction.
+@dataclass(slots=True)
 class ValidationResult:
     topic_id: str
     ok: bool
     errors: list[str]
-    warnings: list[str]
+    warnings: list[WarningItem]
     stats: dict[str, Any]
 
 
-def _validate_sources(topic_dir: Path, *, topic_id: str) -> tuple[list[str], list[str], dict[str, Any]]:
+def _validate_sources(
+    topic_dir: Path,
+    *,
+    topic_id: str,
+    entries: dict[str, os.DirEntry[str]],
+    digest_entries: dict[str, os.DirEntry[str]],
+) -> tuple[list[str], list[WarningItem], dict[str, Any]]:
     errors: list[str] = []
-    warnings: list[str] = []
+    warnings: list[WarningItem] = []
     stats: dict[str, Any] = {"sources_rows": 0, "sources_missing_digests": 0, "sources_unsorted": False}
 
     path = topic_dir / "sources.md"
-    if not path.exists():
+    if "sources.md" not in entries:
         errors.append(f"missing sources.md: {path}")
         return errors, warnings, stats
 
-    lines = path.read_text(encoding="utf-8").splitlines()
-    header_idx = None
-    for i, ln in enumerate(lines):
-        if "| 日期 |" in ln and "| Digest |" in ln:
-            header_idx = i
-            break
-    if header_idx is None:
-        warnings.append("sources.md: sources table header not found")
-        return errors, warnings, stats
-
-    sep_idx = header_idx + 1
-    if sep_idx >= len(lines) or not _is_table_row(lines[sep_idx]):
-        warnings.append("sources.md: sources table separator not found")
-        return errors, warnings, stats
-
-    row_start = sep_idx + 1
-    row_end = row_start
-    while row_end < len(lines) and _is_table_row(lines[row_end]):
-        row_end += 1
-
-    rows = [ln.strip() for ln in lines[row_start:row_end] if _is_table_row(ln)]
-    # Drop placeholder blank row.
-    rows = [r for r in rows if not re.fullmatch(r"\|\s*\|\s*\|\s*\|\s*\|\s*\|\s*\|", r)]
-    stats["sources_rows"] = len(rows)
-
     seen_digest: set[str] = set()
     date_keys: list[str] = []
-    for row in rows:
-        cells = [c.strip() for c in row.strip("|").split("|")]
-        if len(cells) < 5:
-            warnings.append(f"sources.md: malformed row (expected 5 cols): {row}")
-            continue
-        date_raw, _typ, _title, _link, digest_cell = cells[:5]
-        digest_rel = _extract_digest_path(digest_cell)
-        if not digest_rel:
-            warnings.append(f"sources.md: empty digest cell: {row}")
-        else:
-            if digest_rel in seen_digest:
-                warnings.append(f"sources.md: duplicate digest entry: {digest_rel}")
-            seen_digest.add(digest_rel)
-            digest_path = (topic_dir / digest_rel).resolve()
-            if not digest_path.exists():
-                errors.append(f"sources.md: digest path not found: {digest_rel}")
-                stats["sources_missing_digests"] += 1
-
-        dk = _normalize_date_key(date_raw)
-        if dk:
-            date_keys.append(dk)
-        else:
-            warnings.append(f"sources.md: non-standard date '{date_raw}' (prefer YYYY-MM-DD or YYYY)")
+    # Single streaming pass: header -> separator -> rows; stop reading at the first non-row line.
+    state = "before_header"
+    with path.open(encoding="utf-8") as f:
+        for ln in f:
+            if state == "before_header":
+                if "| 日期 |" in ln and "| Digest |" in ln:
+                    state = "separator"
+                continue
+            row = ln.strip()
+            if state == "separator":
+                if not _is_table_row(row):
+                    break
+                state = "rows"
+                continue
+            if not _is_table_row(row):
+                break
+
+            # Drop placeholder blank row.
+            if _SOURCES_PLACEHOLDER_ROW_RE.fullmatch(row):
+                continue
+            stats["sources_rows"] += 1
+
+            # maxsplit=5: only the first five cells are used; any remainder stays unsplit.
+            cells = row.strip("|").split("|", 5)
+            if len(cells) < 5:
+                warnings.append(("sources_malformed_row", (row,)))
+                continue
+            date_raw = cells[0].strip()
+            digest_rel = _extract_digest_path(cells[4])
+            if not digest_rel:
+                warnings.append(("sources_empty_digest_cell", (row,)))
+            else:
+                if digest_rel in seen_digest:
+                    warnings.append(("sources_duplicate_digest", (digest_rel,)))
+                seen_digest.add(digest_rel)
+                rel_parts = PurePosixPath(digest_rel).parts
+                if len(rel_parts) == 2 and rel_parts[0] == "digests" and rel_parts[1] in digest_entries:
+                    found = True
+                else:
+                    found = (topic_dir / digest_rel).resolve().exists()
+                if not found:
+                    errors.append(f"sources.md: digest path not found: {digest_rel}")
+                    stats["sources_missing_digests"] += 1
+
+            dk = _normalize_date_key(date_raw)
+            if dk:
+                date_keys.append(dk)
+            else:
+                warnings.append(("sources_nonstandard_date", (date_raw,)))
+
+    if state == "before_header":
+        warnings.append(("sources_header_not_found", ()))
+        return errors, warnings, stats
+    if state == "separator":
+        warnings.append(("sources_separator_not_found", ()))
+        return errors, warnings, stats
 
     # Newest-first is recommended for sources.md; only flag when we have comparable keys.
     comparable = [d for d in date_keys if d]
     if comparable and comparable != sorted(comparable, reverse=True):
         stats["sources_unsorted"] = True
-        warnings.append("sources.md: rows are not sorted by date (recommended: newest first)")
+        warnings.append(("sources_unsorted", ()))
 
     return errors, warnings, stats
 
 
-def _validate_timeline(topic_dir: Path) -> tuple[list[str], list[str], dict[str, Any]]:
+def _validate_timeline(
+    topic_dir: Path, *, entries: dict[str, os.DirEntry[str]]
+) -> tuple[list[str], list[WarningItem], dict[str, Any]]:
     errors: list[str] = []
-    warnings: list[str] = []
+    warnings: list[WarningItem] = []
     stats: dict[str, Any] = {"timeline_entries": 0, "timeline_unsorted": False}
 
     path = topic_dir / "timeline.md"
-    if not path.exists():
+    if "timeline.md" not in entries:
         errors.append(f"missing timeline.md: {path}")
         return errors, warnings, stats
 
@@ -178,87 +247,153 @@ def _validate_timeline(topic_dir: Path) -> tuple[list[str], list[str], dict[str,
     stats["timeline_entries"] = len(dates)
     if dates and dates != sorted(dates):
         stats["timeline_unsorted"] = True
-        warnings.append("timeline.md: entries are not sorted by date (recommended: oldest first)")
+        warnings.append(("timeline_unsorted", ()))
     return errors, warnings, stats
 
 
-def _find_claim_ledger_table(lines: list[str]) -> tuple[int | None, list[str] | None]:
-    for i, ln in enumerate(lines):
-        if ln.strip() == "## Claim Ledger（断言清单，建议用于投研/行业研究）" or ln.strip() == "## Claim Ledger":
-            # Search forward for the next table header row.
-            for j in range(i + 1, min(len(lines), i + 80)):
-                if _is_table_row(lines[j]) and "claim" in lines[j]:
-                    header = [c.strip() for c in lines[j].strip().strip("|").split("|")]
-                    return j, header
-            return i, None
+def _claim_ledger_header_after(lines: list[str], i: int) -> tuple[int, list[str] | None]:
+    # Search forward (bounded window) for the next table header row.
+    for j in range(i + 1, min(len(lines), i + 80)):
+        row = lines[j].strip()
+        if _is_table_row(row) and "claim" in row:
+            header = [c.strip() for c in row.strip("|").split("|")]
+            return j, header
+    return i, None
+
+
+def _find_claim_ledger_table(
+    lines: list[str], *, start: int = 0, text: str | None = None
+) -> tuple[int | None, list[str] | None]:
+    if text is not None and len(lines) == text.count("\n") + (not text.endswith("\n")):
+        # Every line break is \n-based, so regex offsets map exactly onto splitlines() indices:
+        # locate the heading with one C-level scan instead of stripping every line in Python.
+        for m in _CLAIM_LEDGER_HEADING_RE.finditer(text):
+            i = text.count("\n", 0, m.start())
+            if i >= start:
+                return _claim_ledger_header_after(lines, i)
+        return None, None
+
+    for i in range(start, len(lines)):
+        if lines[i].strip() in _CLAIM_LEDGER_HEADINGS:
+            return _claim_ledger_header_after(lines, i)
     return None, None
 
 
-def _validate_digest(digest_path: Path, *, topic_id: str) -> tuple[list[str], list[str], dict[str, Any]]:
+def _validate_digest(digest_entry: os.DirEntry[str], *, topic_id: str) -> tuple[list[str], list[WarningItem], dict[str, Any]]:
     errors: list[str] = []
-    warnings: list[str] = []
+    warnings: list[WarningItem] = []
     stats: dict[str, Any] = {"has_frontmatter": False, "has_claim_ledger": False, "has_claim_id": False}
 
-    raw = digest_path.read_text(encoding="utf-8")
-    fm, body = _parse_frontmatter(raw)
+    # Peek at the first block: a digest that cannot start with frontmatter fails without reading or
+    # decoding the rest. splitlines() already handles \r\n, so read_text()'s newline translation is skipped.
+    with open(digest_entry.path, "rb") as f:
+        head = f.read(4096)
+        if not head.startswith(b"---"):
+            errors.append(f"digest missing frontmatter: {digest_entry.path}")
+            return errors, warnings, stats
+        text = (head + f.read()).decode("utf-8")
+    lines = text.splitlines()
+    fm, body_start = _parse_frontmatter_lines(lines)
     if fm:
         stats["has_frontmatter"] = True
     else:
-        errors.append(f"digest missing frontmatter: {digest_path}")
+        errors.append(f"digest missing frontmatter: {digest_entry.path}")
         return errors, warnings, stats
 
     got_topic = str(fm.get("topic_id") or "").strip()
     if not got_topic:
-        warnings.append(f"digest missing topic_id frontmatter: {digest_path.name}")
+        warnings.append(("digest_missing_topic_id", (digest_entry.name,)))
     elif got_topic != topic_id:
-        errors.append(f"digest topic_id mismatch: {digest_path.name} frontmatter={got_topic} dir={topic_id}")
+        errors.append(f"digest topic_id mismatch: {digest_entry.name} frontmatter={got_topic} dir={topic_id}")
 
-    lines = body.splitlines()
-    idx, header = _find_claim_ledger_table(lines)
+    idx, header = _find_claim_ledger_table(lines, start=body_start, text=text)
     if idx is None:
-        warnings.append(f"digest missing Claim Ledger section: {digest_path.name}")
+        warnings.append(("digest_missing_claim_ledger", (digest_entry.name,)))
         return errors, warnings, stats
     stats["has_claim_ledger"] = True
 
     if not header:
-        warnings.append(f"digest Claim Ledger table header not found: {digest_path.name}")
+        warnings.append(("digest_claim_ledger_header_not_found", (digest_entry.name,)))
         return errors, warnings, stats
 
     header_norm = [h.strip().lower().replace(" ", "") for h in header]
     required = {"claim", "核验状态", "来源/证据（url/出处/时间戳/帧）"}
     if "claim" not in header_norm:
-        warnings.append(f"digest Claim Ledger missing 'claim' column: {digest_path.name}")
+        warnings.append(("digest_claim_ledger_missing_claim", (digest_entry.name,)))
 
     has_claim_id = "claim_id" in header_norm or "claimid" in header_norm
     stats["has_claim_id"] = has_claim_id
     if not has_claim_id:
-        warnings.append(f"digest Claim Ledger missing claim_id (recommended): {digest_path.name}")
+        warnings.append(("digest_claim_ledger_missing_claim_id", (digest_entry.name,)))
 
     # If claim_id exists, ensure uniqueness for non-empty ids.
     if has_claim_id:
         claim_id_idx = header_norm.index("claim_id") if "claim_id" in header_norm else header_norm.index("claimid")
-        # Walk table rows until it ends.
+        # Walk table rows until it ends; split only as far as the claim_id cell.
         seen: set[str] = set()
         for ln in lines[idx + 2 :]:
-            if not _is_table_row(ln):
+            row = ln.strip()
+            if not _is_table_row(row):
                 break
-            cells = [c.strip() for c in ln.strip().strip("|").split("|")]
+            cells = row.strip("|").split("|", claim_id_idx + 1)
             if claim_id_idx >= len(cells):
                 continue
-            cid = cells[claim_id_idx].strip("`").strip()
+            cid = cells[claim_id_idx].strip().strip("`").strip()
             if not cid:
                 continue
             if cid in seen:
-                warnings.append(f"digest duplicate claim_id '{cid}': {digest_path.name}")
+                warnings.append(("digest_duplicate_claim_id", (cid, digest_entry.name)))
             seen.add(cid)
 
     return errors, warnings, stats
 
 
-def _validate_topic(topic_dir: Path) -> ValidationResult:
+def _load_digest_cache(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _DIGEST_CACHE_VERSION:
+        return {}
+    topics = data.get("topics")
+    return topics if isinstance(topics, dict) else {}
+
+
+def _atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding=encoding,
+            delete=False,
+            dir=str(path.parent),
+            prefix=path.name + ".tmp.",
+        ) as f:
+            tmp_path = Path(f.name)
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(str(tmp_path), str(path))
+    finally:
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _save_digest_cache(path: Path, topics: dict[str, Any]) -> None:
+    payload = {"version": _DIGEST_CACHE_VERSION, "topics": topics}
+    _atomic_write_text(path, json.dumps(payload, ensure_ascii=False) + "\n")
+
+
+def _validate_topic(topic_dir: Path, digest_cache: dict[str, Any] | None = None) -> ValidationResult:
+    # digest_cache maps digest file name -> {"key": [mtime_ns, size], "errors", "warnings", "stats"}; it is
+    # rewritten in place to hold exactly the digests seen in this run.
     topic_id = topic_dir.name
     errors: list[str] = []
-    warnings: list[str] = []
+    warnings: list[WarningItem] = []
     stats: dict[str, Any] = {
         "topic_dir": str(topic_dir),
         "digests": 0,
@@ -266,21 +401,39 @@ def _validate_topic(topic_dir: Path) -> ValidationResult:
         "digests_with_claim_id": 0,
     }
 
+    entries = _scan_dir(topic_dir)
     required = ["overview.md", "framework.md", "sources.md", "timeline.md", "open_questions.md"]
     for name in required:
-        if not (topic_dir / name).exists():
+        if name not in entries:
             errors.append(f"missing required file: {name}")
 
-    digests_dir = topic_dir / "digests"
-    if not digests_dir.exists():
+    digest_entries: dict[str, os.DirEntry[str]] = {}
+    if "digests" not in entries:
         errors.append("missing digests/ directory")
-        digests: list[Path] = []
+        digests: list[os.DirEntry[str]] = []
     else:
-        digests = sorted(digests_dir.glob("*.md"), key=lambda p: p.name)
+        digest_entries = _scan_dir(topic_dir / "digests")
+        # DirEntry caches is_file()/stat(), so neither filtering nor the cache key costs another syscall.
+        digests = sorted(
+            (e for e in digest_entries.values() if e.name.endswith(".md") and e.is_file()), key=lambda e: e.name
+        )
     stats["digests"] = len(digests)
 
+    prev_cache = dict(digest_cache) if digest_cache is not None else {}
+    if digest_cache is not None:
+        digest_cache.clear()
     for digest in digests:
-        d_err, d_warn, d_stats = _validate_digest(digest, topic_id=topic_id)
+        if digest_cache is None:
+            d_err, d_warn, d_stats = _validate_digest(digest, topic_id=topic_id)
+        else:
+            st = digest.stat()
+            key = [st.st_mtime_ns, st.st_size]
+            hit = prev_cache.get(digest.name)
+            if isinstance(hit, dict) and hit.get("key") == key:
+                d_err, d_warn, d_stats = hit["errors"], hit["warnings"], hit["stats"]
+            else:
+                d_err, d_warn, d_stats = _validate_digest(digest, topic_id=topic_id)
+            digest_cache[digest.name] = {"key": key, "errors": d_err, "warnings": d_warn, "stats": d_stats}
         errors.extend(d_err)
         warnings.extend(d_warn)
         if d_stats.get("has_claim_ledger"):
@@ -288,33 +441,46 @@ def _validate_topic(topic_dir: Path) -> ValidationResult:
         if d_stats.get("has_claim_id"):
             stats["digests_with_claim_id"] += 1
 
-    s_err, s_warn, s_stats = _validate_sources(topic_dir, topic_id=topic_id)
+    s_err, s_warn, s_stats = _validate_sources(
+        topic_dir, topic_id=topic_id, entries=entries, digest_entries=digest_entries
+    )
     errors.extend(s_err)
     warnings.extend(s_warn)
     stats.update(s_stats)
 
-    t_err, t_warn, t_stats = _validate_timeline(topic_dir)
+    t_err, t_warn, t_stats = _validate_timeline(topic_dir, entries=entries)
     errors.extend(t_err)
     warnings.extend(t_warn)
     stats.update(t_stats)
 
-    overview_path = topic_dir / "overview.md"
-    if overview_path.exists():
-        overview_text = overview_path.read_text(encoding="utf-8")
-        if "digests/" not in overview_text:
-            warnings.append("overview.md: no digest references found (recommended to cite digests)")
+    if "overview.md" in entries:
+        # Only a substring test is needed, so search the raw bytes and skip the UTF-8 decode.
+        if b"digests/" not in (topic_dir / "overview.md").read_bytes():
+            warnings.append(("overview_no_digest_refs", ()))
 
     ok = not errors
     return ValidationResult(topic_id=topic_id, ok=ok, errors=errors, warnings=warnings, stats=stats)
 
 
+def _validate_topic_job(job: tuple[Path, dict[str, Any] | None]) -> tuple[ValidationResult, dict[str, Any] | None]:
+    # Process-pool entry point: the worker's copy of the per-topic cache is shipped back to the parent.
+    topic_dir, digest_cache = job
+    return _validate_topic(topic_dir, digest_cache), digest_cache
+
+
+def _dumps_json_bytes(payload: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def _emit_human(result: ValidationResult) -> None:
     status = "OK" if result.ok else "FAIL"
     sys.stdout.write(f"[{status}] topic={result.topic_id}\n")
     for e in result.errors:
         sys.stdout.write(f"  - ERROR: {e}\n")
     for w in result.warnings:
-        sys.stdout.write(f"  - WARN: {w}\n")
+        sys.stdout.write(f"  - WARN: {_format_warning(w)}\n")
     sys.stdout.write(f"  - stats: {json.dumps(result.stats, ensure_ascii=False)}\n")
 
 
@@ -326,25 +492,56 @@ def main(argv: list[str]) -> int:
     parser.add_argument("--json", action="store_true", help="Print JSON only.")
     parser.add_argument("--out", help="Write JSON result to a file.")
     parser.add_argument("--fail-on-warn", action="store_true", help="Exit non-zero if any warnings.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for --all (default: CPU count; 1 = sequential).",
+    )
+    parser.add_argument(
+        "--cache-path",
+        default="state/cache/topic_validate.json",
+        help="Per-digest result cache keyed by (mtime, size); relative to the repo root (default: state/cache/topic_validate.json)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Re-validate every digest and leave the cache untouched.")
     args = parser.parse_args(argv)
 
     topic_root = Path(args.topic_root).expanduser().resolve()
     if not topic_root.exists():
         raise SystemExit(f"topic-root not found: {topic_root}")
 
-    results: list[ValidationResult] = []
+    repo_root = Path(__file__).resolve().parents[1]
+    cache_path = repo_root / Path(args.cache_path).expanduser()  # relative paths live under the repo, not the cwd
+    cache: dict[str, Any] | None = None if args.no_cache else _load_digest_cache(cache_path)
+
     if args.all:
-        for child in sorted(topic_root.iterdir()):
-            if not child.is_dir():
-                continue
-            if not _TOPIC_ID_RE.match(child.name):
-                continue
-            results.append(_validate_topic(child))
+        topic_dirs = [
+            child for child in sorted(topic_root.iterdir()) if child.is_dir() and _TOPIC_ID_RE.match(child.name)
+        ]
     else:
         tid = (args.topic_id or "").strip()
         if not tid or not _TOPIC_ID_RE.match(tid):
             raise SystemExit("topic_id required (or use --all)")
-        results.append(_validate_topic((topic_root / tid).resolve()))
+        topic_dirs = [(topic_root / tid).resolve()]
+
+    jobs_in = [(d, None if cache is None else dict(cache.get(str(d)) or {})) for d in topic_dirs]
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    jobs = min(jobs, len(jobs_in))
+    if jobs <= 1:
+        outcomes = [_validate_topic_job(job) for job in jobs_in]
+    else:
+        # Topics share no state; executor.map keeps results in sorted topic order.
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            outcomes = list(executor.map(_validate_topic_job, jobs_in, chunksize=4))
+    results: list[ValidationResult] = [r for r, _ in outcomes]
+
+    if cache is not None:
+        for topic_dir, (_r, topic_cache) in zip(topic_dirs, outcomes):
+            cache[str(topic_dir)] = topic_cache
+        try:
+            _save_digest_cache(cache_path, cache)
+        except OSError as exc:
+            sys.stderr.write(f"warning: failed to write digest cache {cache_path}: {exc}\n")
 
     payload = {
         "generated_at": datetime.now().astimezone().isoformat(),
@@ -354,20 +551,24 @@ def main(argv: list[str]) -> int:
                 "topic_id": r.topic_id,
                 "ok": r.ok,
                 "errors": r.errors,
-                "warnings": r.warnings,
+                "warnings": [_format_warning(w) for w in r.warnings],
+                "warning_codes": [code for code, _args in r.warnings],
                 "stats": r.stats,
             }
             for r in results
         ],
     }
 
+    # Serialize once; --out and --json share the same bytes.
+    blob = _dumps_json_bytes(payload) + b"\n" if (args.out or args.json) else b""
     if args.out:
         out_path = Path(args.out).expanduser()
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        out_path.write_bytes(blob)
 
     if args.json:
-        sys.stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+        sys.stdout.buffer.write(blob)
     else:
         for r in results:
             _emit_human(r)
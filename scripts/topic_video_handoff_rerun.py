@@ -7,15 +7,21 @@ import os
 import re
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any, Dict, List, Optional
 
+import generate_video_digest_via_web_research as gvd
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SCRIPTS_DIR = REPO_ROOT / "scripts"
+_STDERR_TAIL_LINES = 50
 
 
 def _now_iso() -> str:
@@ -55,47 +61,59 @@ class SourceRow:
     bvid: str
 
 
-def _parse_sources_table(path: Path) -> tuple[Optional[str], List[SourceRow]]:
-    text = _read_text(path)
+def _parse_sources_table(
+    path: Path, *, filter_bvids: Optional[set[str]] = None, limit: int = 0
+) -> tuple[Optional[str], List[SourceRow]]:
     mid: Optional[str] = None
     rows: List[SourceRow] = []
 
-    in_table = False
-    for ln in text.splitlines():
-        if ln.strip().startswith("| 日期 |"):
-            in_table = True
-            continue
-        if not in_table:
-            continue
-        if ln.strip().startswith("|---"):
-            continue
-        if not ln.strip().startswith("|"):
-            # End of table.
-            break
-        parts = [p.strip() for p in ln.strip().strip("|").split("|")]
-        if len(parts) < 5:
-            continue
-        date, typ, title, link, digest = parts[:5]
-        if typ.lower() == "up":
-            m = re.search(r"space\\.bilibili\\.com/(\\d+)", link)
-            if m:
-                mid = m.group(1)
-            continue
-        if typ.lower() != "video":
-            continue
-        bvm = re.search(r"(BV[0-9A-Za-z]+)", link) or re.search(r"(BV[0-9A-Za-z]+)", digest)
-        if not bvm:
-            continue
-        bvid = bvm.group(1)
-        rows.append(
-            SourceRow(
-                published_at=str(date).strip(),
-                title=str(title).strip(),
-                url=str(link).strip(),
-                digest_rel=str(digest).strip(),
-                bvid=bvid,
+    # Single streaming pass: header -> separator -> rows; the rest of the file is never read.
+    state = "before_header"
+    with path.open(encoding="utf-8", errors="replace") as f:
+        for ln in f:
+            s = ln.strip()
+            if state == "before_header":
+                if s.startswith("| 日期 |"):
+                    state = "separator"
+                continue
+            if state == "separator":
+                state = "rows"
+                if s.startswith("|---"):
+                    continue
+            if s[:1] != "|":
+                # End of table.
+                break
+            parts = s.strip("|").split("|", 5)
+            if len(parts) < 5:
+                continue
+            date, typ, title, link, digest = (p.strip() for p in parts[:5])
+            if typ.lower() == "up":
+                m = re.search(r"space\\.bilibili\\.com/(\\d+)", link)
+                if m:
+                    mid = m.group(1)
+                continue
+            if typ.lower() != "video":
+                continue
+            if limit > 0 and len(rows) >= limit:
+                if mid is not None:
+                    break
+                # Keep scanning only for a later "up" row that carries the mid.
+                continue
+            bvm = re.search(r"(BV[0-9A-Za-z]+)", link) or re.search(r"(BV[0-9A-Za-z]+)", digest)
+            if not bvm:
+                continue
+            bvid = bvm.group(1)
+            if filter_bvids is not None and bvid not in filter_bvids:
+                continue
+            rows.append(
+                SourceRow(
+                    published_at=str(date).strip(),
+                    title=str(title).strip(),
+                    url=str(link).strip(),
+                    digest_rel=str(digest).strip(),
+                    bvid=bvid,
+                )
             )
-        )
     return mid, rows
 
 
@@ -104,21 +122,22 @@ def _parse_failed_bvids_from_record(path: Path) -> set[str]:
     failed: set[str] = set()
     in_table = False
     for ln in text.splitlines():
-        if ln.strip().startswith("| # | bvid |"):
+        s = ln.strip()
+        if s.startswith("| # | bvid |"):
             in_table = True
             continue
         if not in_table:
             continue
-        if ln.strip().startswith("|---"):
+        if s.startswith("|---"):
             continue
-        if not ln.strip().startswith("|"):
+        if s[:1] != "|":
             # End of table.
             break
-        parts = [p.strip() for p in ln.strip().strip("|").split("|")]
+        parts = s.strip("|").split("|", 4)
         if len(parts) < 4:
             continue
-        bvid = parts[1]
-        status = parts[3].lower()
+        bvid = parts[1].strip()
+        status = parts[3].strip().lower()
         if not bvid.startswith("BV"):
             continue
         if status.startswith("ok"):
@@ -127,23 +146,33 @@ def _parse_failed_bvids_from_record(path: Path) -> set[str]:
     return failed
 
 
-def _find_analysis_dir(*, mid: Optional[str], published_at: str, bvid: str) -> Optional[Path]:
+def _scan_analysis_dirs() -> List[str]:
+    # One scandir up front; per-row lookups then never touch the filesystem.
+    base = REPO_ROOT / "state" / "video-analyses"
+    try:
+        with os.scandir(base) as it:
+            return sorted(e.name for e in it if e.is_dir())
+    except FileNotFoundError:
+        return []
+
+
+def _find_analysis_dir(
+    *, mid: Optional[str], published_at: str, bvid: str, analysis_names: List[str], analysis_name_set: set[str]
+) -> Optional[Path]:
+    base = REPO_ROOT / "state" / "video-analyses"
     yyyymmdd = _date_to_yyyymmdd(published_at)
     if mid and yyyymmdd:
-        cand = REPO_ROOT / "state" / "video-analyses" / f"bili_{mid}_{yyyymmdd}_{bvid}"
-        if cand.exists():
-            return cand
+        name = f"bili_{mid}_{yyyymmdd}_{bvid}"
+        if name in analysis_name_set:
+            return base / name
 
     # Fallback: search by BV id.
-    base = REPO_ROOT / "state" / "video-analyses"
-    if not base.exists():
-        return None
-    hits = sorted([p for p in base.iterdir() if p.is_dir() and bvid in p.name])
-    for p in hits:
-        if p.name.endswith("_refined_small"):
+    hits = [n for n in analysis_names if bvid in n]
+    for n in hits:
+        if n.endswith("_refined_small"):
             continue
-        return p
-    return hits[0] if hits else None
+        return base / n
+    return base / hits[0] if hits else None
 
 
 def _safe_repo_path(path_raw: str) -> Path:
@@ -170,7 +199,27 @@ def _run_digest(
     no_gemini: bool,
     max_transcript_chars: int,
     chatgpt_mcp_url: str,
+    use_subprocess: bool = False,
 ) -> Dict[str, Any]:
+    if not use_subprocess:
+        # In-process by default: saves an interpreter start-up + imports per video.
+        try:
+            return gvd.run_digest(
+                analysis_dir=analysis_dir,
+                topic_id=topic_id,
+                output=out_path,
+                published_at=published_at,
+                source_url=source_url,
+                timeout_seconds=timeout_seconds,
+                no_gemini=no_gemini,
+                max_transcript_chars=max_transcript_chars,
+                chatgpt_mcp_url=chatgpt_mcp_url,
+            )
+        except RuntimeError:
+            raise
+        except Exception as exc:
+            raise RuntimeError(f"digest failed: {exc}") from exc
+
     cmd: List[str] = [
         sys.executable,
         str(SCRIPTS_DIR / "generate_video_digest_via_web_research.py"),
@@ -195,10 +244,22 @@ def _run_digest(
     if chatgpt_mcp_url:
         cmd.extend(["--chatgpt-mcp-url", chatgpt_mcp_url])
 
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    if proc.returncode != 0:
-        raise RuntimeError((proc.stderr or proc.stdout or "").strip() or f"digest failed (exit={proc.returncode})")
-    out = (proc.stdout or "").strip()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    assert proc.stdout is not None
+    assert proc.stderr is not None
+    # Drain stderr on a thread into a bounded tail so neither pipe can fill up and stall the child.
+    err_tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+    err_reader = threading.Thread(target=err_tail.extend, args=(proc.stderr,), daemon=True)
+    err_reader.start()
+    # The --json result is the last non-empty stdout line; earlier output is not retained.
+    out = ""
+    for line in proc.stdout:
+        if line.strip():
+            out = line.strip()
+    returncode = proc.wait()
+    err_reader.join()
+    if returncode != 0:
+        raise RuntimeError("".join(err_tail).strip() or out or f"digest failed (exit={returncode})")
     try:
         return json.loads(out)
     except Exception:
@@ -217,6 +278,17 @@ def main(argv: List[str]) -> int:
     ap.add_argument("--no-gemini", action="store_true")
     ap.add_argument("--chatgpt-mcp-url", default="")
     ap.add_argument("--limit", type=int, default=0, help="Process first N videos (0=all).")
+    ap.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Videos processed in parallel (default: 1 = serial with --sleep-between pacing).",
+    )
+    ap.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run each digest in a separate Python process (isolation; default: in-process).",
+    )
     args = ap.parse_args(argv)
 
     topic_id = str(args.topic_id).strip()
@@ -234,10 +306,9 @@ def main(argv: List[str]) -> int:
     record_path_raw = str(args.record_path).strip()
     record_path = _safe_repo_path(record_path_raw) if record_path_raw else None
 
-    mid, rows = _parse_sources_table(sources)
-    if not rows:
-        _die(f"no video rows found in sources table: {sources}")
-
+    # Build the --only-failed-from filter first so the sources scan keeps only matching rows and can
+    # stop once --limit is reached.
+    failed_bvids: Optional[set[str]] = None
     only_failed_from_raw = str(args.only_failed_from).strip()
     if only_failed_from_raw:
         only_failed_path = _safe_repo_path(only_failed_from_raw)
@@ -246,13 +317,12 @@ def main(argv: List[str]) -> int:
         failed_bvids = _parse_failed_bvids_from_record(only_failed_path)
         if not failed_bvids:
             _die(f"no failed bvids found in record: {only_failed_path}")
-        rows = [r for r in rows if r.bvid in failed_bvids]
-        if not rows:
-            _die("after filtering by --only-failed-from, no matching video rows remain")
 
-    limit = int(args.limit)
-    if limit > 0:
-        rows = rows[:limit]
+    mid, rows = _parse_sources_table(sources, filter_bvids=failed_bvids, limit=int(args.limit))
+    if not rows:
+        if failed_bvids is not None:
+            _die("after filtering by --only-failed-from, no matching video rows remain")
+        _die(f"no video rows found in sources table: {sources}")
 
     if record_path is not None:
         _append_md(
@@ -270,6 +340,7 @@ def main(argv: List[str]) -> int:
                 (f"- only_failed_from: `{only_failed_from_raw}`" if only_failed_from_raw else "- only_failed_from:"),
                 f"- timeout_seconds: {int(args.timeout_seconds)}",
                 f"- sleep_between: {float(args.sleep_between)}",
+                f"- concurrency: {int(args.concurrency)}",
                 "",
                 "## Progress",
                 "",
@@ -278,19 +349,23 @@ def main(argv: List[str]) -> int:
             ],
         )
 
-    ok = 0
-    failed = 0
-    for idx, row in enumerate(rows, start=1):
-        analysis_dir = _find_analysis_dir(mid=mid, published_at=row.published_at, bvid=row.bvid)
-        digest_path = (REPO_ROOT / "archives" / "topics" / topic_id / row.digest_rel).resolve(strict=False)
-        if analysis_dir is None or not analysis_dir.exists():
-            failed += 1
-            if record_path is not None:
-                _append_md(
-                    record_path,
-                    [f"| {idx} | {row.bvid} | {row.published_at} | missing_analysis | `{row.digest_rel}` |  |  |"],
-                )
-            continue
+    topic_dir = REPO_ROOT / "archives" / "topics" / topic_id
+    analysis_names = _scan_analysis_dirs()  # sorted, for the BV-id fallback
+    analysis_name_set = set(analysis_names)  # O(1) exact-name lookups
+
+    def _process(idx: int, row: SourceRow) -> tuple[bool, str, bool]:
+        # Returns (ok, progress table row, whether a digest run was attempted).
+        analysis_dir = _find_analysis_dir(
+            mid=mid,
+            published_at=row.published_at,
+            bvid=row.bvid,
+            analysis_names=analysis_names,
+            analysis_name_set=analysis_name_set,
+        )
+        # Plain join: the output path needs no resolve() (and no stat of every parent) per row.
+        digest_path = topic_dir.joinpath(*PurePosixPath(row.digest_rel).parts)
+        if analysis_dir is None:
+            return False, f"| {idx} | {row.bvid} | {row.published_at} | missing_analysis | `{row.digest_rel}` |  |  |", False
 
         try:
             result = _run_digest(
@@ -303,38 +378,62 @@ def main(argv: List[str]) -> int:
                 no_gemini=bool(args.no_gemini),
                 max_transcript_chars=int(args.max_transcript_chars),
                 chatgpt_mcp_url=str(args.chatgpt_mcp_url).strip(),
+                use_subprocess=bool(args.subprocess),
             )
-            ok += 1
-            if record_path is not None:
-                _append_md(
-                    record_path,
-                    [
-                        "| "
-                        + " | ".join(
-                            [
-                                str(idx),
-                                row.bvid,
-                                row.published_at,
-                                "ok",
-                                f"`{row.digest_rel}`",
-                                (result.get("chatgpt_conversation_url") or "").strip(),
-                                (result.get("gemini_conversation_url") or "").strip(),
-                            ]
-                        )
-                        + " |"
-                    ],
-                )
         except Exception as exc:
-            failed += 1
-            if record_path is not None:
-                msg = str(exc).replace("\n", " ").strip()
-                msg = (msg[:180] + "…") if len(msg) > 180 else msg
-                _append_md(
-                    record_path,
-                    [f"| {idx} | {row.bvid} | {row.published_at} | failed ({msg}) | `{row.digest_rel}` |  |  |"],
-                )
+            msg = str(exc).replace("\n", " ").strip()
+            msg = (msg[:180] + "…") if len(msg) > 180 else msg
+            return False, f"| {idx} | {row.bvid} | {row.published_at} | failed ({msg}) | `{row.digest_rel}` |  |  |", True
+
+        line = (
+            "| "
+            + " | ".join(
+                [
+                    str(idx),
+                    row.bvid,
+                    row.published_at,
+                    "ok",
+                    f"`{row.digest_rel}`",
+                    (result.get("chatgpt_conversation_url") or "").strip(),
+                    (result.get("gemini_conversation_url") or "").strip(),
+                ]
+            )
+            + " |"
+        )
+        return True, line, True
+
+    concurrency = int(args.concurrency)
+
+    def _outcomes():
+        if concurrency <= 1:
+            for idx, row in enumerate(rows, start=1):
+                yield _process(idx, row)
+            return
+        # Digest runs mostly wait on MCP responses, so threads overlap them; --sleep-between only
+        # paces the serial mode. Rows are recorded from this thread in completion order.
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(_process, idx, row) for idx, row in enumerate(rows, start=1)]
+            for fut in as_completed(futures):
+                yield fut.result()
 
-        time.sleep(float(args.sleep_between))
+    ok = 0
+    failed = 0
+    # One handle for all progress rows instead of an open/close per video; flush keeps the record tail-able.
+    rec_fh = record_path.open("a", encoding="utf-8") if record_path is not None else None
+    try:
+        for row_ok, line, ran in _outcomes():
+            if row_ok:
+                ok += 1
+            else:
+                failed += 1
+            if rec_fh is not None:
+                rec_fh.write(line.rstrip() + "\n")
+                rec_fh.flush()
+            if ran and concurrency <= 1:
+                time.sleep(float(args.sleep_between))
+    finally:
+        if rec_fh is not None:
+            rec_fh.close()
 
     if record_path is not None:
         _append_md(
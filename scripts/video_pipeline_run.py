@@ -2,15 +2,22 @@
 from __future__ import annotations
 
 import argparse
+import fcntl
 import json
 import logging
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+from fractions import Fraction
 from pathlib import Path
 from typing import Any, Dict, List
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+FFPROBE_CACHE_PATH = REPO_ROOT / "state" / "video-analyses" / ".ffprobe_cache.json"
+FFPROBE_BIN = shutil.which("ffprobe") or "ffprobe"
 
 
 def _die(msg: str, code: int = 2) -> None:
@@ -18,32 +25,106 @@ def _die(msg: str, code: int = 2) -> None:
     raise SystemExit(code)
 
 
-def _ffprobe_wh(video_path: Path) -> tuple[int, int] | None:
+def _ffprobe_cache_key(video_path: Path) -> str | None:
     try:
-        out = subprocess.check_output(
+        st = video_path.stat()
+        return f"{video_path.resolve()}:{st.st_size}:{st.st_mtime_ns}"
+    except OSError:
+        return None
+
+
+def _load_ffprobe_cache() -> Dict[str, Any]:
+    try:
+        data = json.loads(FFPROBE_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_ffprobe_cache(key: str, value: Any) -> None:
+    # Batch drivers may run several runners at once: serialize the read-modify-write
+    # on a sidecar lock, then swap the file in atomically.
+    try:
+        FFPROBE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{FFPROBE_CACHE_PATH}.lock", "a") as lock_fh:
+            fcntl.flock(lock_fh, fcntl.LOCK_EX)
+            # Drop entries for files that are gone or have changed since they were probed.
+            cache = {
+                k: v
+                for k, v in _load_ffprobe_cache().items()
+                if _ffprobe_cache_key(Path(k.rsplit(":", 2)[0])) == k
+            }
+            cache[key] = value
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=str(FFPROBE_CACHE_PATH.parent),
+                prefix=f".{FFPROBE_CACHE_PATH.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                tmp.write(json.dumps(cache, ensure_ascii=False))
+                tmp_name = tmp.name
+            os.replace(tmp_name, FFPROBE_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _ffprobe_meta(video_path: Path) -> Dict[str, Any] | None:
+    # One ffprobe call for everything the runner and pipeline need (size, duration, fps).
+    key = _ffprobe_cache_key(video_path)
+    if key is not None:
+        hit = _load_ffprobe_cache().get(key)
+        if isinstance(hit, dict):
+            return hit
+    try:
+        proc = subprocess.run(
             [
-                "ffprobe",
+                FFPROBE_BIN,
                 "-v",
                 "error",
-                "-select_streams",
-                "v:0",
-                "-show_entries",
-                "stream=width,height",
+                "-show_streams",
+                "-show_format",
                 "-of",
-                "csv=s=x:p=0",
+                "json",
                 str(video_path),
             ],
+            capture_output=True,
             text=True,
-        ).strip()
+            check=False,
+        )
+        if proc.returncode != 0:
+            return None
+        data = json.loads(proc.stdout)
     except Exception:
         return None
-    if not out or "x" not in out:
+    if not isinstance(data, dict):
         return None
+
+    stream: Dict[str, Any] = {}
+    for st in data.get("streams") or []:
+        if isinstance(st, dict) and st.get("codec_type") == "video":
+            stream = st
+            break
+    meta: Dict[str, Any] = {"width": None, "height": None, "duration_sec": None, "fps": None}
     try:
-        w_s, h_s = out.split("x", 1)
-        return int(w_s), int(h_s)
+        meta["width"], meta["height"] = int(stream["width"]), int(stream["height"])
     except Exception:
-        return None
+        pass
+    try:
+        meta["duration_sec"] = float((data.get("format") or {})["duration"])
+    except Exception:
+        pass
+    try:
+        fps = Fraction(str(stream["r_frame_rate"]))
+        meta["fps"] = float(fps) if fps > 0 else None
+    except Exception:
+        pass
+
+    # Cache complete probes only, so a transient or partial ffprobe failure is retried next run.
+    if key is not None and all(meta[k] is not None for k in ("width", "height", "duration_sec")):
+        _store_ffprobe_cache(key, meta)
+    return meta
 
 
 def main(argv: List[str]) -> int:
@@ -59,6 +140,12 @@ def main(argv: List[str]) -> int:
         default=-1,
         help="Max frame height: 0=no scale, -1=auto (default: vertical=1920, horizontal=1080).",
     )
+    ap.add_argument(
+        "--frame-extractor",
+        choices=("image2", "pipe-mjpeg"),
+        default="image2",
+        help="image2: ffmpeg writes the JPEGs; pipe-mjpeg: ffmpeg streams MJPEG to stdout and frames are split here.",
+    )
     ap.add_argument("--enable-ocr", action="store_true", help="Enable OCR (numeric_only).")
     ap.add_argument("--no-asr-vad-filter", action="store_true", help="Disable VAD filter for ASR (may recover quiet speech).")
     ap.add_argument("--overwrite", action="store_true", help="Overwrite existing analysis.")
@@ -80,21 +167,23 @@ def main(argv: List[str]) -> int:
     if out_dir_r != base_dir and base_dir not in out_dir_r.parents:
         _die(f"out_dir must be under {base_dir} (got {out_dir})")
 
-    sys.path.insert(0, str(REPO_ROOT / "mcp-servers" / "video_pipeline"))
-    try:
-        from pipeline import analyze_video  # type: ignore
-    except Exception as e:
-        _die(f"failed to import video_pipeline pipeline.py: {e}")
-
+    probe_meta = _ffprobe_meta(video_path)
     max_height = int(args.max_height)
     if max_height < 0:
-        wh = _ffprobe_wh(video_path)
-        if wh is None:
+        w = (probe_meta or {}).get("width")
+        h = (probe_meta or {}).get("height")
+        if w is None or h is None:
             max_height = 1080
         else:
-            w, h = wh
             max_height = 1920 if h > w else 1080
 
+    # Imported only after the args are validated and the video probed.
+    sys.path.insert(0, str(REPO_ROOT / "mcp-servers" / "video_pipeline"))
+    try:
+        from pipeline import analyze_video  # type: ignore
+    except Exception as e:
+        _die(f"failed to import video_pipeline pipeline.py: {e}")
+
     evidence = analyze_video(
         video_path=video_path,
         out_dir=out_dir,
@@ -112,6 +201,8 @@ def main(argv: List[str]) -> int:
         asr_device="auto",
         asr_compute_type="auto",
         asr_vad_filter=(not bool(args.no_asr_vad_filter)),
+        probe_meta=probe_meta,
+        frame_extractor=str(args.frame_extractor),
     )
 
     structured: Dict[str, Any] = {
@@ -1,18 +1,39 @@
 #!/usr/bin/env python3
 import argparse
+import contextlib
+import glob
+import hashlib
 import json
 import os
 import re
+import tempfile
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Any
-from urllib.parse import urlencode
+from typing import Any, Callable
+from urllib.parse import urlencode, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
 
 
 URL_RE = re.compile(r"https?://[^\s\)\]\}<>\"']+")
+_CODE_FENCE_RE = re.compile(r"\A```[json]*(.*?)```", re.S)
+
+DASHSCOPE_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions"
+BIGMODEL_URL = "https://open.bigmodel.cn/api/paas/v4/web_search"
+TAVILY_URL = "https://api.tavily.com/search"
+BRAVE_URL = "https://api.search.brave.com/res/v1/web/search"
+TONGXIAO_URL = "https://cloud-iqs.aliyuncs.com/search/llm"
 
 
 def _load_dotenv(path: Path) -> dict[str, str]:
@@ -41,26 +62,38 @@ def _get_env(env: dict[str, str], *keys: str) -> str | None:
 
 
 def _extract_urls(text: str) -> list[str]:
-    urls = []
-    for m in URL_RE.finditer(text or ""):
-        urls.append(m.group(0).rstrip(".,;:"))
-    seen: set[str] = set()
-    uniq: list[str] = []
-    for u in urls:
-        if u in seen:
-            continue
-        seen.add(u)
-        uniq.append(u)
-    return uniq
+    if not text:
+        return []
+    return list(dict.fromkeys(m.group(0).rstrip(".,;:") for m in URL_RE.finditer(text)))
+
+
+def _preview(text: str | None, limit: int = 400) -> str:
+    # Cut before replacing so long answers are not copied in full just to be truncated.
+    t = (text or "").strip()
+    if len(t) > limit:
+        return t[:limit].replace("\n", " ") + "…"
+    return t.replace("\n", " ")
+
+
+def _loads_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:  # e.g. an integer beyond 64 bits in a provider payload
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def _strip_code_fences(text: str) -> str:
     t = (text or "").strip()
-    if t.startswith("```"):
-        parts = t.split("```")
-        if len(parts) >= 3:
-            return parts[1].lstrip("json").lstrip().strip()
-    return t
+    m = _CODE_FENCE_RE.match(t)
+    return m.group(1).strip() if m else t
 
 
 def _try_parse_json(text: str) -> Any | None:
@@ -71,26 +104,180 @@ def _try_parse_json(text: str) -> Any | None:
         return None
 
 
+@dataclass(frozen=True)
+class ProviderConfig:
+    url: str
+    api_key: str
+    headers: dict[str, str]
+
+
+def _provider_config(
+    url: str,
+    api_key: str,
+    *,
+    auth_header_name: str | None = None,
+    auth_scheme: str = "",
+    base_headers: dict[str, str] | None = None,
+) -> ProviderConfig:
+    headers = dict(base_headers or {})
+    if auth_header_name:
+        headers[auth_header_name] = f"{auth_scheme} {api_key}" if auth_scheme else api_key
+    return ProviderConfig(url=url, api_key=api_key, headers=headers)
+
+
 @dataclass
 class ProviderResult:
     provider: str
     model: str | None
     ok: bool
-    elapsed_seconds: float
+    elapsed_seconds: float | None
     error: str | None
     answer_preview: str | None
     urls: list[str]
     raw: Any
+    cached: bool = False
+
+
+def _atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding=encoding,
+            delete=False,
+            dir=str(path.parent),
+            prefix=path.name + ".tmp.",
+        ) as f:
+            tmp_path = Path(f.name)
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(str(tmp_path), str(path))
+    finally:
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _cache_key(provider: str, kwargs: dict[str, Any]) -> str:
+    # cfg carries the API key and endpoint, not the query: keep it out of the key.
+    params = {k: v for k, v in kwargs.items() if k != "cfg"}
+    blob = json.dumps([provider, params], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _load_cached_result(path: Path) -> ProviderResult | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        # A replay measures nothing: flag it and leave elapsed_seconds empty so it cannot skew timings.
+        data["cached"] = True
+        data["elapsed_seconds"] = None
+        return ProviderResult(**data)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+_preflight_ok: dict[str, bool] = {}
+_preflight_locks: dict[str, threading.Lock] = {}
+_preflight_guard = threading.Lock()
+
+
+def _preflight(session: requests.Session, url: str, timeout: float = 2.0) -> bool:
+    # One HEAD per host per run: any HTTP answer counts as reachable, only a
+    # connect/timeout failure marks the host down for the rest of the run.
+    host = urlsplit(url).netloc
+    with _preflight_guard:
+        lock = _preflight_locks.setdefault(host, threading.Lock())
+    with lock:
+        if host not in _preflight_ok:
+            try:
+                session.head(f"https://{host}/", timeout=timeout, allow_redirects=False)
+                _preflight_ok[host] = True
+            except requests.RequestException:
+                _preflight_ok[host] = False
+        return _preflight_ok[host]
+
+
+def _call_limited(
+    limit: threading.Semaphore,
+    provider: str,
+    fn: Callable[..., ProviderResult],
+    session: requests.Session,
+    *args: Any,
+    cache_dir: Path | None = None,
+    cache_only: bool = False,
+    preflight: bool = True,
+    **kwargs: Any,
+) -> ProviderResult:
+    model = kwargs.get("model") or kwargs.get("engine")
+    cache_path = cache_dir / f"{_cache_key(provider, kwargs)}.json" if cache_dir is not None else None
+    if cache_path is not None:
+        cached = _load_cached_result(cache_path)
+        if cached is not None:
+            return cached
+        if cache_only:
+            return ProviderResult(
+                provider=provider,
+                model=model,
+                ok=False,
+                elapsed_seconds=0.0,
+                error="cache_miss",
+                answer_preview=None,
+                urls=[],
+                raw=None,
+            )
+
+    started = time.time()
+    cfg = kwargs.get("cfg")
+    if preflight and cfg is not None and not _preflight(session, cfg.url):
+        return ProviderResult(
+            provider=provider,
+            model=model,
+            ok=False,
+            elapsed_seconds=time.time() - started,
+            error="preflight_failed",
+            answer_preview=None,
+            urls=[],
+            raw=None,
+        )
+
+    # Caps in-flight requests per provider so a wide fan-out does not trip 429s.
+    with limit:
+        try:
+            result = fn(session, *args, **kwargs)
+        except Exception as e:
+            # e.g. a non-JSON 200 body: fail this engine/model only, not the whole run.
+            return ProviderResult(
+                provider=provider,
+                model=model,
+                ok=False,
+                elapsed_seconds=time.time() - started,
+                error=f"provider_error: {e}",
+                answer_preview=None,
+                urls=[],
+                raw=None,
+            )
+
+    if cache_path is not None and result.ok:
+        try:
+            _atomic_write_text(cache_path, json.dumps(result.__dict__, ensure_ascii=False))
+        except OSError:
+            pass
+    return result
 
 
 def _dashscope_chat(
-    api_key: str,
+    session: requests.Session,
+    cfg: ProviderConfig,
     model: str,
     query: str,
     timeout_seconds: int,
     want_json: bool,
+    json_mode: bool = False,
 ) -> ProviderResult:
-    url = "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions"
     system = (
         "你是一个检索助手。你必须使用联网搜索能力。"
         "输出时请优先给出可核验的一手来源（官方/标准组织/公司公告/技术白皮书），并提供完整 URL。"
@@ -112,10 +299,11 @@ def _dashscope_chat(
         "temperature": 0.2,
         "max_tokens": 900,
     }
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    if want_json and json_mode:
+        payload["response_format"] = {"type": "json_object"}
     started = time.time()
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=timeout_seconds)
+        resp = session.post(cfg.url, headers=cfg.headers, json=payload, timeout=timeout_seconds)
         elapsed = time.time() - started
     except Exception as e:
         return ProviderResult(
@@ -142,20 +330,19 @@ def _dashscope_chat(
             raw=None,
         )
 
-    data = resp.json()
+    data = _loads_json(resp.content)
     content = (((data.get("choices") or [{}])[0].get("message") or {}).get("content")) or ""
-    parsed = _try_parse_json(content) if want_json else None
     urls: list[str] = []
-    if isinstance(parsed, dict) and isinstance(parsed.get("sources"), list):
-        for s in parsed["sources"]:
-            if isinstance(s, dict) and s.get("url"):
-                urls.append(str(s["url"]))
+    if want_json:
+        parsed = _try_parse_json(content)
+        sources = parsed.get("sources") if isinstance(parsed, dict) else None
+        if isinstance(sources, list):
+            urls = [str(s["url"]) for s in sources if isinstance(s, dict) and s.get("url")]
+    # Free-text answers (or JSON without usable sources): fall back to scanning the content.
     if not urls:
         urls = _extract_urls(content)
 
-    preview = (content or "").strip().replace("\n", " ")
-    if len(preview) > 400:
-        preview = preview[:400] + "…"
+    preview = _preview(content)
 
     return ProviderResult(
         provider="dashscope",
@@ -170,7 +357,8 @@ def _dashscope_chat(
 
 
 def _bigmodel_web_search(
-    api_key: str,
+    session: requests.Session,
+    cfg: ProviderConfig,
     engine: str,
     query: str,
     timeout_seconds: int,
@@ -180,8 +368,6 @@ def _bigmodel_web_search(
     content_size: str = "medium",
     domain_filter: str | None = None,
 ) -> ProviderResult:
-    url = "https://open.bigmodel.cn/api/paas/v4/web_search"
-    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
     payload: dict[str, Any] = {
         "search_engine": engine,
         "search_query": query,
@@ -195,7 +381,7 @@ def _bigmodel_web_search(
 
     started = time.time()
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=timeout_seconds)
+        resp = session.post(cfg.url, headers=cfg.headers, json=payload, timeout=timeout_seconds)
         elapsed = time.time() - started
     except Exception as e:
         return ProviderResult(
@@ -221,7 +407,7 @@ def _bigmodel_web_search(
             raw=None,
         )
 
-    data = resp.json()
+    data = _loads_json(resp.content)
     results = data.get("search_result") or []
     urls = []
     for r in results:
@@ -232,9 +418,7 @@ def _bigmodel_web_search(
         preview = (results[0].get("title") or "").strip()
         if results[0].get("link"):
             preview = (preview + " — " + str(results[0]["link"])).strip()
-    preview = preview.replace("\n", " ")
-    if len(preview) > 400:
-        preview = preview[:400] + "…"
+    preview = _preview(preview)
     return ProviderResult(
         provider="bigmodel_web_search",
         model=engine,
@@ -247,10 +431,9 @@ def _bigmodel_web_search(
     )
 
 
-def _tavily_search(api_key: str, query: str, timeout_seconds: int, max_results: int) -> ProviderResult:
-    url = "https://api.tavily.com/search"
+def _tavily_search(session: requests.Session, cfg: ProviderConfig, query: str, timeout_seconds: int, max_results: int) -> ProviderResult:
     payload: dict[str, Any] = {
-        "api_key": api_key,
+        "api_key": cfg.api_key,
         "query": query,
         "search_depth": "advanced",
         "max_results": max_results,
@@ -259,7 +442,7 @@ def _tavily_search(api_key: str, query: str, timeout_seconds: int, max_results:
     }
     started = time.time()
     try:
-        resp = requests.post(url, json=payload, timeout=timeout_seconds)
+        resp = session.post(cfg.url, json=payload, timeout=timeout_seconds)
         elapsed = time.time() - started
     except Exception as e:
         return ProviderResult(
@@ -283,14 +466,12 @@ def _tavily_search(api_key: str, query: str, timeout_seconds: int, max_results:
             urls=[],
             raw=None,
         )
-    data = resp.json()
+    data = _loads_json(resp.content)
     urls = []
     for r in data.get("results") or []:
         if isinstance(r, dict) and r.get("url"):
             urls.append(str(r["url"]))
-    preview = (data.get("answer") or "").strip().replace("\n", " ")
-    if len(preview) > 400:
-        preview = preview[:400] + "…"
+    preview = _preview(data.get("answer"))
     return ProviderResult(
         provider="tavily",
         model=None,
@@ -303,16 +484,14 @@ def _tavily_search(api_key: str, query: str, timeout_seconds: int, max_results:
     )
 
 
-def _brave_search(api_key: str, query: str, timeout_seconds: int, count: int) -> ProviderResult:
-    base = "https://api.search.brave.com/res/v1/web/search"
+def _brave_search(session: requests.Session, cfg: ProviderConfig, query: str, timeout_seconds: int, count: int) -> ProviderResult:
     # Brave expects a fixed enum for search_lang (e.g. "en", "zh-hans", "zh-hant").
     # Default to "en" to avoid 422 validation errors across installations.
     params = {"q": query, "count": str(count), "search_lang": "en"}
-    url = f"{base}?{urlencode(params)}"
-    headers = {"X-Subscription-Token": api_key, "Accept": "application/json"}
+    url = f"{cfg.url}?{urlencode(params)}"
     started = time.time()
     try:
-        resp = requests.get(url, headers=headers, timeout=timeout_seconds)
+        resp = session.get(url, headers=cfg.headers, timeout=timeout_seconds)
         elapsed = time.time() - started
     except Exception as e:
         return ProviderResult(
@@ -336,7 +515,7 @@ def _brave_search(api_key: str, query: str, timeout_seconds: int, count: int) ->
             urls=[],
             raw=None,
         )
-    data = resp.json()
+    data = _loads_json(resp.content)
     urls = []
     for r in (((data.get("web") or {}).get("results")) or []):
         if isinstance(r, dict) and r.get("url"):
@@ -345,9 +524,7 @@ def _brave_search(api_key: str, query: str, timeout_seconds: int, count: int) ->
     top = (((data.get("web") or {}).get("results")) or [])[:1]
     if top and isinstance(top[0], dict):
         preview = (top[0].get("title") or "") + " — " + (top[0].get("description") or "")
-    preview = preview.strip().replace("\n", " ")
-    if len(preview) > 400:
-        preview = preview[:400] + "…"
+    preview = _preview(preview)
     return ProviderResult(
         provider="brave",
         model=None,
@@ -360,13 +537,11 @@ def _brave_search(api_key: str, query: str, timeout_seconds: int, count: int) ->
     )
 
 
-def _tongxiao_iqs_search(api_key: str, query: str, timeout_seconds: int, num_results: int) -> ProviderResult:
-    url = "https://cloud-iqs.aliyuncs.com/search/llm"
-    headers = {"X-API-Key": api_key, "Content-Type": "application/json"}
+def _tongxiao_iqs_search(session: requests.Session, cfg: ProviderConfig, query: str, timeout_seconds: int, num_results: int) -> ProviderResult:
     payload = {"query": query, "numResults": num_results}
     started = time.time()
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=timeout_seconds)
+        resp = session.post(cfg.url, headers=cfg.headers, json=payload, timeout=timeout_seconds)
         elapsed = time.time() - started
     except Exception as e:
         return ProviderResult(
@@ -390,7 +565,7 @@ def _tongxiao_iqs_search(api_key: str, query: str, timeout_seconds: int, num_res
             urls=[],
             raw=None,
         )
-    data = resp.json()
+    data = _loads_json(resp.content)
     urls = []
     items = data.get("pageItems") or []
     for item in items:
@@ -399,9 +574,7 @@ def _tongxiao_iqs_search(api_key: str, query: str, timeout_seconds: int, num_res
     preview = ""
     if items and isinstance(items[0], dict):
         preview = (items[0].get("title") or "") + " — " + (items[0].get("summary") or items[0].get("snippet") or "")
-    preview = preview.strip().replace("\n", " ")
-    if len(preview) > 400:
-        preview = preview[:400] + "…"
+    preview = _preview(preview)
     return ProviderResult(
         provider="tongxiao_iqs",
         model=None,
@@ -430,35 +603,387 @@ DEFAULT_QUERIES: list[dict[str, str]] = [
 ]
 
 
-def _write_markdown_summary(path: Path, rows: list[dict[str, Any]]) -> None:
-    lines: list[str] = []
-    lines.append("# websearch benchmark")
-    lines.append("")
-    lines.append(f"- generated_at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
-    for row in rows:
-        lines.append(f"## {row['query_id']}")
-        lines.append("")
-        lines.append(f"- query: {row['query']}")
-        lines.append("")
-        for r in row["results"]:
-            tag = f"{r['provider']}" + (f"/{r['model']}" if r.get("model") else "")
-            if r["ok"]:
-                lines.append(f"- {tag}: ok ({r['elapsed_seconds']:.2f}s), urls={len(r['urls'])}")
-                if r.get("answer_preview"):
-                    lines.append(f"  - preview: {r['answer_preview']}")
-                for u in r["urls"][:8]:
-                    lines.append(f"  - {u}")
+def _write_json_row(fh: Any, row: dict[str, Any], *, first: bool) -> None:
+    # Same layout as dumping the whole list with indent=2, one element at a time
+    # (serialized JSON has no raw newlines inside strings, so re-indenting is safe).
+    fh.write(b"\n  " if first else b",\n  ")
+    fh.write(_dumps_json_bytes(row).replace(b"\n", b"\n  "))
+
+
+def _flat_records(row: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {
+            "query_id": row["query_id"],
+            "query": row["query"],
+            "provider": r["provider"],
+            "model": r["model"],
+            "ok": r["ok"],
+            "elapsed_seconds": r["elapsed_seconds"],
+            "cached": r.get("cached", False),
+            "error": r["error"],
+            "answer_preview": r["answer_preview"],
+            "urls": r["urls"],
+        }
+        for r in row["results"]
+    ]
+
+
+def _write_parquet(path: Path, records: list[dict[str, Any]]) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema(
+        [
+            ("query_id", pa.string()),
+            ("query", pa.string()),
+            ("provider", pa.dictionary(pa.int32(), pa.string())),
+            ("model", pa.dictionary(pa.int32(), pa.string())),
+            ("ok", pa.bool_()),
+            ("elapsed_seconds", pa.float64()),
+            ("cached", pa.bool_()),
+            ("error", pa.string()),
+            ("answer_preview", pa.string()),
+            ("urls", pa.list_(pa.string())),
+        ]
+    )
+    pq.write_table(pa.Table.from_pylist(records, schema=schema), str(path), compression="zstd")
+
+
+class _MarkdownWriter:
+    # Streams lines to fh with the same result as "\n".join(lines).rstrip() + "\n":
+    # the last non-blank line and any blank lines after it are held back until
+    # more text arrives or close() trims them.
+    def __init__(self, fh: Any) -> None:
+        self._fh = fh
+        self._started = False
+        self._tail: list[str] = []
+
+    def line(self, text: str = "") -> None:
+        if text.strip():
+            for held in self._tail:
+                self._fh.write(("\n" if self._started else "") + held)
+                self._started = True
+            self._tail = []
+        self._tail.append(text)
+
+    def close(self) -> None:
+        self._fh.write(("\n" if self._started else "") + "\n".join(self._tail).rstrip() + "\n")
+        self._tail = []
+
+
+def _write_markdown_header(md: _MarkdownWriter) -> None:
+    md.line("# websearch benchmark")
+    md.line()
+    md.line(f"- generated_at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    md.line()
+
+
+def _write_markdown_section(md: _MarkdownWriter, row: dict[str, Any]) -> None:
+    md.line(f"## {row['query_id']}")
+    md.line()
+    md.line(f"- query: {row['query']}")
+    md.line()
+    for r in row["results"]:
+        tag = f"{r['provider']}" + (f"/{r['model']}" if r.get("model") else "")
+        if r["ok"]:
+            timing = "cached" if r.get("cached") else f"{r['elapsed_seconds']:.2f}s"
+            md.line(f"- {tag}: ok ({timing}), urls={len(r['urls'])}")
+            if r.get("answer_preview"):
+                md.line(f"  - preview: {r['answer_preview']}")
+            for u in r["urls"][:8]:
+                md.line(f"  - {u}")
+        else:
+            md.line(f"- {tag}: FAIL ({r['elapsed_seconds']:.2f}s) {r.get('error','')}")
+    md.line()
+
+
+def _run_benchmark(args: argparse.Namespace, queries_json: str | None, stem: str) -> list[Path]:
+    # One full benchmark over one query file; writes <out-dir>/<stem>.{json|parquet,md}.
+    repo_root = Path(__file__).resolve().parents[1]
+    env = _load_dotenv(repo_root / ".env")
+
+    dashscope_key = _get_env(env, "DASHSCOPE_API_KEY", "WEBSEARCH_API_KEY")
+    bigmodel_key = _get_env(env, "BIGMODEL_API_KEY")
+    tavily_key = _get_env(env, "TAVILY_API_KEY", "tavilyApiKey")
+    brave_key = _get_env(env, "BRAVE_API_KEY", "braveapikey")
+    tongxiao_key = _get_env(env, "TONGXIAO_API_KEY")
+
+    json_headers = {"Content-Type": "application/json"}
+    dashscope_cfg = bigmodel_cfg = tavily_cfg = brave_cfg = tongxiao_cfg = None
+    if dashscope_key:
+        dashscope_cfg = _provider_config(
+            DASHSCOPE_URL, dashscope_key, auth_header_name="Authorization", auth_scheme="Bearer", base_headers=json_headers
+        )
+    if bigmodel_key:
+        bigmodel_cfg = _provider_config(
+            BIGMODEL_URL, bigmodel_key, auth_header_name="Authorization", auth_scheme="Bearer", base_headers=json_headers
+        )
+    if tavily_key:
+        tavily_cfg = _provider_config(TAVILY_URL, tavily_key)
+    if brave_key:
+        brave_cfg = _provider_config(
+            BRAVE_URL, brave_key, auth_header_name="X-Subscription-Token", base_headers={"Accept": "application/json"}
+        )
+    if tongxiao_key:
+        tongxiao_cfg = _provider_config(TONGXIAO_URL, tongxiao_key, auth_header_name="X-API-Key", base_headers=json_headers)
+
+    cache_dir = (repo_root / args.cache_dir).resolve() if args.cache or args.cache_only else None
+
+    out_dir = (repo_root / args.out_dir).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_json = out_dir / f"{stem}.json"
+    out_parquet = out_dir / f"{stem}.parquet"
+    as_parquet = args.output_format == "parquet"
+    out_md = out_dir / f"{stem}.md"
+
+    queries = DEFAULT_QUERIES
+    if queries_json:
+        queries = json.loads(Path(queries_json).read_text(encoding="utf-8"))
+
+    dashscope_models = [m.strip() for m in str(args.dashscope_models).split(",") if m.strip()]
+    bigmodel_engines = [e.strip() for e in str(args.bigmodel_engines).split(",") if e.strip()]
+
+    concurrency = max(1, int(args.concurrency))
+    providers = {
+        _dashscope_chat: "dashscope",
+        _bigmodel_web_search: "bigmodel_web_search",
+        _tavily_search: "tavily",
+        _brave_search: "brave",
+        _tongxiao_iqs_search: "tongxiao_iqs",
+    }
+    per_provider = max(1, int(args.per_provider_concurrency))
+    limits = {fn: threading.Semaphore(per_provider) for fn in providers}
+    # Every provider is a single host: keep one keep-alive pool per host, sized to the
+    # most connections that host can have in flight. Transient 429/5xx get two backed-off
+    # retries; if they persist the last response is reported as before.
+    retry = Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=len(providers), pool_maxsize=min(concurrency, per_provider), max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    rows: list[dict[str, Any] | None] = []
+    records: list[dict[str, Any]] = []
+    outstanding: list[int] = []
+    futures = {}
+    written = 0
+
+    def _flush_rows() -> None:
+        # Emit finished rows in query order to both reports, then let them go.
+        nonlocal written
+        while written < len(rows) and outstanding[written] == 0:
+            if as_parquet:
+                records.extend(_flat_records(rows[written]))
             else:
-                lines.append(f"- {tag}: FAIL ({r['elapsed_seconds']:.2f}s) {r.get('error','')}")
-        lines.append("")
-    path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+                _write_json_row(out_fh, rows[written], first=(written == 0))
+            _write_markdown_section(md, rows[written])
+            rows[written] = None
+            written += 1
+
+    with (
+        session,
+        ThreadPoolExecutor(max_workers=concurrency) as executor,
+        (contextlib.nullcontext() if as_parquet else out_json.open("wb")) as out_fh,
+        out_md.open("w", encoding="utf-8") as md_fh,
+    ):
+        if out_fh is not None:
+            out_fh.write(b"[")
+        md = _MarkdownWriter(md_fh)
+        _write_markdown_header(md)
+        for q in queries:
+            qid = q.get("id") or "query"
+            query = q.get("query") or ""
+            # Each slot is either a ready ProviderResult (missing key) or a (fn, kwargs) call;
+            # (query index, slot index) keeps the output order stable regardless of completion order.
+            slots: list[ProviderResult | tuple[Callable[..., ProviderResult], dict[str, Any]]] = []
+
+            if not args.no_dashscope:
+                if not dashscope_key:
+                    slots.append(
+                        ProviderResult(
+                            provider="dashscope",
+                            model=",".join(dashscope_models) or None,
+                            ok=False,
+                            elapsed_seconds=0.0,
+                            error="missing DASHSCOPE_API_KEY/WEBSEARCH_API_KEY",
+                            answer_preview=None,
+                            urls=[],
+                            raw=None,
+                        )
+                    )
+                else:
+                    for model in dashscope_models:
+                        slots.append(
+                            (
+                                _dashscope_chat,
+                                {
+                                    "cfg": dashscope_cfg,
+                                    "model": model,
+                                    "query": query,
+                                    "timeout_seconds": args.timeout,
+                                    "want_json": True,
+                                    "json_mode": bool(args.dashscope_json_mode),
+                                },
+                            )
+                        )
+
+            if not args.no_bigmodel:
+                if not bigmodel_key:
+                    slots.append(
+                        ProviderResult(
+                            provider="bigmodel_web_search",
+                            model=",".join(bigmodel_engines) or None,
+                            ok=False,
+                            elapsed_seconds=0.0,
+                            error="missing BIGMODEL_API_KEY",
+                            answer_preview=None,
+                            urls=[],
+                            raw=None,
+                        )
+                    )
+                else:
+                    for engine in bigmodel_engines:
+                        slots.append(
+                            (
+                                _bigmodel_web_search,
+                                {
+                                    "cfg": bigmodel_cfg,
+                                    "engine": engine,
+                                    "query": query,
+                                    "timeout_seconds": args.timeout,
+                                    "count": args.max_results,
+                                    "recency": str(args.bigmodel_recency),
+                                    "content_size": str(args.bigmodel_content_size),
+                                },
+                            )
+                        )
+
+            if not args.no_tavily:
+                if not tavily_key:
+                    slots.append(
+                        ProviderResult(
+                            provider="tavily",
+                            model=None,
+                            ok=False,
+                            elapsed_seconds=0.0,
+                            error="missing TAVILY_API_KEY/tavilyApiKey",
+                            answer_preview=None,
+                            urls=[],
+                            raw=None,
+                        )
+                    )
+                else:
+                    slots.append(
+                        (
+                            _tavily_search,
+                            {"cfg": tavily_cfg, "query": query, "timeout_seconds": args.timeout, "max_results": args.max_results},
+                        )
+                    )
+
+            if not args.no_brave:
+                if not brave_key:
+                    slots.append(
+                        ProviderResult(
+                            provider="brave",
+                            model=None,
+                            ok=False,
+                            elapsed_seconds=0.0,
+                            error="missing BRAVE_API_KEY/braveapikey",
+                            answer_preview=None,
+                            urls=[],
+                            raw=None,
+                        )
+                    )
+                else:
+                    slots.append(
+                        (
+                            _brave_search,
+                            {"cfg": brave_cfg, "query": query, "timeout_seconds": args.timeout, "count": args.max_results},
+                        )
+                    )
+
+            if not args.no_tongxiao:
+                if not tongxiao_key:
+                    slots.append(
+                        ProviderResult(
+                            provider="tongxiao_iqs",
+                            model=None,
+                            ok=False,
+                            elapsed_seconds=0.0,
+                            error="missing TONGXIAO_API_KEY",
+                            answer_preview=None,
+                            urls=[],
+                            raw=None,
+                        )
+                    )
+                else:
+                    slots.append(
+                        (
+                            _tongxiao_iqs_search,
+                            {
+                                "cfg": tongxiao_cfg,
+                                "query": query,
+                                "timeout_seconds": args.timeout,
+                                "num_results": args.max_results,
+                            },
+                        )
+                    )
+
+            results: list[dict[str, Any] | None] = [None] * len(slots)
+            pending = 0
+            for idx, slot in enumerate(slots):
+                if isinstance(slot, ProviderResult):
+                    results[idx] = slot.__dict__
+                else:
+                    fn, kwargs = slot
+                    future = executor.submit(
+                        _call_limited,
+                        limits[fn],
+                        providers[fn],
+                        fn,
+                        session,
+                        cache_dir=cache_dir,
+                        cache_only=bool(args.cache_only),
+                        preflight=not args.no_preflight,
+                        **kwargs,
+                    )
+                    futures[future] = (len(rows), idx)
+                    pending += 1
+
+            rows.append({"query_id": qid, "query": query, "results": results})
+            outstanding.append(pending)
+
+        _flush_rows()
+        for fut in as_completed(futures):
+            query_idx, slot_idx = futures.pop(fut)
+            rows[query_idx]["results"][slot_idx] = fut.result().__dict__
+            outstanding[query_idx] -= 1
+            _flush_rows()
+
+        if out_fh is not None:
+            out_fh.write(b"\n]" if rows else b"]")
+        md.close()
+
+    if as_parquet:
+        _write_parquet(out_parquet, records)
+    return [out_parquet if as_parquet else out_json, out_md]
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Benchmark multiple web search backends with real project queries.")
     parser.add_argument("--out-dir", default="state/tmp/websearch_benchmark", help="Output directory (default: state/tmp/...)")
     parser.add_argument("--dashscope-models", default="qwen-turbo,qwen3-max", help="Comma-separated models for DashScope (enable_search)")
+    parser.add_argument(
+        "--dashscope-json-mode",
+        action="store_true",
+        help='Send response_format={"type": "json_object"} to DashScope (not every model accepts it with enable_search)',
+    )
     parser.add_argument("--max-results", type=int, default=5, help="Max results for Tavily/Brave (default: 5)")
     parser.add_argument("--timeout", type=int, default=45, help="Per-request timeout seconds (default: 45)")
     parser.add_argument("--no-dashscope", action="store_true", help="Skip DashScope enable_search tests")
@@ -485,155 +1010,84 @@ def main() -> int:
     parser.add_argument("--no-tavily", action="store_true", help="Skip Tavily tests")
     parser.add_argument("--no-brave", action="store_true", help="Skip Brave tests")
     parser.add_argument("--no-tongxiao", action="store_true", help="Skip Tongxiao IQS (Quark) tests")
-    parser.add_argument("--queries-json", default=None, help="Optional JSON file with [{id, query}]")
+    parser.add_argument(
+        "--queries-json",
+        nargs="+",
+        default=None,
+        help="Optional JSON file(s) or glob(s) with [{id, query}]; each file gets its own report",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run up to N query files in parallel processes (default: 1); concurrency limits apply per process",
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="Max in-flight requests overall (default: 8)")
+    parser.add_argument(
+        "--per-provider-concurrency",
+        type=int,
+        default=3,
+        help="Max in-flight requests per provider (default: 3)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default="state/tmp/websearch_cache",
+        help="Where --cache keeps successful provider responses (default: state/tmp/websearch_cache)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Replay cached provider responses and store new ones (replayed rows are marked cached, with no timing)",
+    )
+    parser.add_argument("--cache-only", action="store_true", help="Never hit the providers; report cache misses as failures")
+    parser.add_argument(
+        "--no-preflight",
+        action="store_true",
+        help="Skip the per-host HEAD reachability check before the first call",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("json", "parquet"),
+        default="json",
+        help="json: full rows incl. raw payloads; parquet: one flat row per (query, provider) without raw (needs pyarrow)",
+    )
     args = parser.parse_args()
+    if args.output_format == "parquet":
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            parser.error("--output-format parquet requires pyarrow")
 
-    repo_root = Path(__file__).resolve().parents[1]
-    env = _load_dotenv(repo_root / ".env")
-
-    dashscope_key = _get_env(env, "DASHSCOPE_API_KEY", "WEBSEARCH_API_KEY")
-    bigmodel_key = _get_env(env, "BIGMODEL_API_KEY")
-    tavily_key = _get_env(env, "TAVILY_API_KEY", "tavilyApiKey")
-    brave_key = _get_env(env, "BRAVE_API_KEY", "braveapikey")
-    tongxiao_key = _get_env(env, "TONGXIAO_API_KEY")
+    queries_files: list[str | None] = []
+    for pattern in args.queries_json or []:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if not matches:
+            parser.error(f"--queries-json matched no files: {pattern}")
+        queries_files.extend(matches)
+    if not queries_files:
+        queries_files = [None]
 
-    out_dir = (repo_root / args.out_dir).resolve()
-    out_dir.mkdir(parents=True, exist_ok=True)
     timestamp = time.strftime("%Y%m%d_%H%M%S")
-    out_json = out_dir / f"benchmark_{timestamp}.json"
-    out_md = out_dir / f"benchmark_{timestamp}.md"
-
-    queries = DEFAULT_QUERIES
-    if args.queries_json:
-        queries = json.loads(Path(args.queries_json).read_text(encoding="utf-8"))
-
-    dashscope_models = [m.strip() for m in str(args.dashscope_models).split(",") if m.strip()]
-    bigmodel_engines = [e.strip() for e in str(args.bigmodel_engines).split(",") if e.strip()]
-
-    rows: list[dict[str, Any]] = []
-    for q in queries:
-        qid = q.get("id") or "query"
-        query = q.get("query") or ""
-        results: list[dict[str, Any]] = []
-
-        if not args.no_dashscope:
-            if not dashscope_key:
-                results.append(
-                    ProviderResult(
-                        provider="dashscope",
-                        model=",".join(dashscope_models) or None,
-                        ok=False,
-                        elapsed_seconds=0.0,
-                        error="missing DASHSCOPE_API_KEY/WEBSEARCH_API_KEY",
-                        answer_preview=None,
-                        urls=[],
-                        raw=None,
-                    ).__dict__
-                )
-            else:
-                for model in dashscope_models:
-                    r = _dashscope_chat(
-                        api_key=dashscope_key,
-                        model=model,
-                        query=query,
-                        timeout_seconds=args.timeout,
-                        want_json=True,
-                    )
-                    results.append(r.__dict__)
-
-        if not args.no_bigmodel:
-            if not bigmodel_key:
-                results.append(
-                    ProviderResult(
-                        provider="bigmodel_web_search",
-                        model=",".join(bigmodel_engines) or None,
-                        ok=False,
-                        elapsed_seconds=0.0,
-                        error="missing BIGMODEL_API_KEY",
-                        answer_preview=None,
-                        urls=[],
-                        raw=None,
-                    ).__dict__
-                )
-            else:
-                for engine in bigmodel_engines:
-                    r = _bigmodel_web_search(
-                        api_key=bigmodel_key,
-                        engine=engine,
-                        query=query,
-                        timeout_seconds=args.timeout,
-                        count=args.max_results,
-                        recency=str(args.bigmodel_recency),
-                        content_size=str(args.bigmodel_content_size),
-                    )
-                    results.append(r.__dict__)
-
-        if not args.no_tavily:
-            if not tavily_key:
-                results.append(
-                    ProviderResult(
-                        provider="tavily",
-                        model=None,
-                        ok=False,
-                        elapsed_seconds=0.0,
-                        error="missing TAVILY_API_KEY/tavilyApiKey",
-                        answer_preview=None,
-                        urls=[],
-                        raw=None,
-                    ).__dict__
-                )
-            else:
-                r = _tavily_search(api_key=tavily_key, query=query, timeout_seconds=args.timeout, max_results=args.max_results)
-                results.append(r.__dict__)
-
-        if not args.no_brave:
-            if not brave_key:
-                results.append(
-                    ProviderResult(
-                        provider="brave",
-                        model=None,
-                        ok=False,
-                        elapsed_seconds=0.0,
-                        error="missing BRAVE_API_KEY/braveapikey",
-                        answer_preview=None,
-                        urls=[],
-                        raw=None,
-                    ).__dict__
-                )
-            else:
-                r = _brave_search(api_key=brave_key, query=query, timeout_seconds=args.timeout, count=args.max_results)
-                results.append(r.__dict__)
-
-        if not args.no_tongxiao:
-            if not tongxiao_key:
-                results.append(
-                    ProviderResult(
-                        provider="tongxiao_iqs",
-                        model=None,
-                        ok=False,
-                        elapsed_seconds=0.0,
-                        error="missing TONGXIAO_API_KEY",
-                        answer_preview=None,
-                        urls=[],
-                        raw=None,
-                    ).__dict__
-                )
-            else:
-                r = _tongxiao_iqs_search(
-                    api_key=tongxiao_key,
-                    query=query,
-                    timeout_seconds=args.timeout,
-                    num_results=args.max_results,
-                )
-                results.append(r.__dict__)
-
-        rows.append({"query_id": qid, "query": query, "results": results})
+    stems: list[str] = []
+    if len(queries_files) == 1:
+        stems.append(f"benchmark_{timestamp}")
+    else:
+        for i, f in enumerate(queries_files):
+            stem = f"benchmark_{Path(str(f)).stem}_{timestamp}"
+            if stem in stems:
+                stem = f"benchmark_{Path(str(f)).stem}_{i}_{timestamp}"
+            stems.append(stem)
 
-    out_json.write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
-    _write_markdown_summary(out_md, rows)
+    jobs = max(1, min(int(args.jobs), len(queries_files)))
+    if jobs == 1:
+        outputs = [_run_benchmark(args, f, stem) for f, stem in zip(queries_files, stems)]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            outputs = list(pool.map(_run_benchmark, repeat(args), queries_files, stems))
 
-    print(f"OK: wrote {out_json}")
-    print(f"OK: wrote {out_md}")
+    for paths in outputs:
+        for path in paths:
+            print(f"OK: wrote {path}")
     return 0
 
 
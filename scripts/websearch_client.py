@@ -2,78 +2,779 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
+import hashlib
 import json
+import os
+import queue
+import re
+import signal
+import socket
+import socketserver
+import stat
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+# Top-level id of a JSON-RPC reply when it leads the frame (as the router writes it).
+_LEADING_ID_RE = re.compile(rb'\{(?:"jsonrpc":\s*"2\.0",\s*)?"id":\s*(\d+)\s*[,}]')
+
+
+def _loads_json(raw: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:  # e.g. an integer beyond 64 bits in a router payload
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# Request params that never change are serialized once; frames only add the id envelope.
+_INITIALIZE_PARAMS = _dumps_json_bytes(
+    {"protocolVersion": "2025-06-18", "clientInfo": {"name": "websearch_client", "version": "0.1"}, "capabilities": {}}
+)
+
+
+def _frame_head(request_id: int, method: str) -> bytes:
+    # The frame is head + params_json + b"}\n"; the (possibly large) params bytes are written as-is, never re-joined.
+    return b'{"jsonrpc":"2.0","id":%d,"method":"%s","params":' % (request_id, method.encode("ascii"))
+
+
+def _tool_call_params(tool_name: str, tool_args: Dict[str, Any]) -> bytes:
+    return _dumps_json_bytes({"name": tool_name, "arguments": tool_args})
+
+
+def _write_json_line(obj: Any) -> None:
+    # Results can be large: write the encoded bytes as-is, or stream-encode, rather than build "<json>\n" copies.
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj)
+        except TypeError:
+            pass
+        else:
+            out = sys.stdout.buffer
+            out.write(data)
+            out.write(b"\n")
+            out.flush()
+            return
+    json.dump(obj, sys.stdout, ensure_ascii=False)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def _atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding=encoding,
+            delete=False,
+            dir=str(path.parent),
+            prefix=path.name + ".tmp.",
+        ) as f:
+            tmp_path = Path(f.name)
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(str(tmp_path), str(path))
+    finally:
+        if tmp_path is not None:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
 
 
 def _repo_root() -> Path:
-    return Path(__file__).resolve().parent.parent
-
-
-def _run_stdio_mcp_call(repo_root: Path, *, tool_name: str, tool_args: Dict[str, Any], timeout_sec: float) -> Dict[str, Any]:
-    cmd = ["bash", str(repo_root / "scripts" / "run_websearch_router_mcp.sh")]
-    req_lines = [
-        json.dumps(
-            {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {"protocolVersion": "2025-06-18", "clientInfo": {"name": "websearch_client", "version": "0.1"}, "capabilities": {}},
-            },
-            ensure_ascii=False,
-        ),
-        json.dumps(
-            {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": tool_name, "arguments": tool_args}},
-            ensure_ascii=False,
-        ),
-        "",
-    ]
+    return _REPO_ROOT
 
-    started = time.time()
-    cp = subprocess.run(
-        cmd,
-        input="\n".join(req_lines),
-        text=True,
-        cwd=str(repo_root),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        timeout=max(5.0, float(timeout_sec) + 30.0),
-        check=False,
-    )
-    if cp.returncode != 0:
-        raise SystemExit(f"websearch_router MCP failed (code={cp.returncode}): {cp.stderr.strip()}")
 
-    messages: List[Dict[str, Any]] = []
-    for line in cp.stdout.splitlines():
-        line = line.strip()
-        if not line:
+def _load_dotenv(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    env: dict[str, str] = {}
+    for raw in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+        line = raw.strip()
+        if line.startswith("export "):
+            line = line[len("export ") :].lstrip()
+        if not line or line.startswith("#") or "=" not in line:
             continue
+        key, value = line.split("=", 1)
+        key = key.strip()
+        value = value.strip()
+        if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
+            value = value[1:-1]
+        env[key] = value
+    return env
+
+
+def _router_cmd_and_env(repo_root: Path) -> Tuple[List[str], Dict[str, str]]:
+    # What scripts/run_websearch_router_mcp.sh does, minus the extra bash process:
+    # .env is sourced over the inherited environment, then server.py is exec'd.
+    env = dict(os.environ)
+    env["WEBSEARCH_ROUTER_REPO_ROOT"] = str(repo_root)
+    env.update(_load_dotenv(repo_root / ".env"))
+    return [sys.executable, str(repo_root / "mcp-servers" / "websearch_router" / "server.py")], env
+
+
+# Put on a waiter's queue when the router's stdout closes.
+_EOF: Dict[str, Any] = {}
+
+
+def _wait_budget(timeout_sec: float, max_wait_sec: float | None) -> float:
+    # timeout_sec is per provider request inside the router, which may fall back through several
+    # providers; the default cap leaves room for that. Replies are returned the moment they arrive,
+    # so this only bounds a stuck router and adds no latency.
+    if max_wait_sec is not None:
+        return float(max_wait_sec)
+    return max(5.0, float(timeout_sec) + 30.0)
+
+
+class WebsearchMCPSession:
+    # One websearch_router MCP process: initialized once, then reused for many tool calls.
+    def __init__(self, repo_root: Path, *, startup_timeout_sec: float = 30.0) -> None:
+        self._repo_root = repo_root
+        self._startup_timeout_sec = startup_timeout_sec
+        self._proc: subprocess.Popen[bytes] | None = None
+        # Replies are routed by id to the waiting caller, so threads can share one session.
+        self._waiters: Dict[int, queue.Queue[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future[Dict[str, Any]]] = {}
+        self._reader: threading.Thread | None = None
+        self._stderr_reader: threading.Thread | None = None
+        self._eof = False
+        self._stderr_tail: deque[bytes] = deque(maxlen=50)
+        self._next_id = 1
+
+    def __enter__(self) -> "WebsearchMCPSession":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._proc is not None:
+            return
+        cmd, env = _router_cmd_and_env(self._repo_root)
+        self._proc = subprocess.Popen(
+            cmd,
+            cwd=str(self._repo_root),
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self._reader = threading.Thread(target=self._read_stdout, daemon=True)
+        self._reader.start()
+        self._stderr_reader = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_reader.start()
         try:
-            messages.append(json.loads(line))
-        except Exception:
-            continue
+            self._request("initialize", _INITIALIZE_PARAMS, timeout_sec=self._startup_timeout_sec)
+        except BaseException:
+            self.close()  # a retry starts a fresh router; never leave this one orphaned
+            raise
 
-    resp = next((m for m in messages if m.get("id") == 2), None)
-    if resp is None:
-        raise SystemExit(f"Missing response for tool call. stderr={cp.stderr.strip()}")
-    if "error" in resp:
-        raise SystemExit(json.dumps(resp["error"], ensure_ascii=False))
+    def close(self) -> None:
+        proc = self._proc
+        if proc is None:
+            return
+        self._proc = None
+        try:
+            assert proc.stdin is not None
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and not self._eof
+
+    def call(
+        self,
+        tool_name: str,
+        tool_args: Dict[str, Any],
+        *,
+        timeout_sec: float,
+        max_wait_sec: float | None = None,
+    ) -> Dict[str, Any]:
+        # Single-flight: a caller asking for a call that is already on the wire waits for that reply.
+        key = f"{tool_name}:{_cache_key(tool_args)}:{bool(tool_args.get('use_cache', True))}"
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                fut: Future[Dict[str, Any]] = Future()
+                self._inflight[key] = fut
+        if inflight is not None:
+            return dict(inflight.result())
+
+        try:
+            started = time.time()
+            resp = self._request(
+                "tools/call",
+                _tool_call_params(tool_name, tool_args),
+                timeout_sec=_wait_budget(timeout_sec, max_wait_sec),
+            )
+            structured, error = _structured_result(resp)
+            if error is not None:
+                raise SystemExit(error)
+            structured["_elapsed_sec"] = structured["_call_elapsed_sec"] = round(time.time() - started, 3)
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        fut.set_result(structured)
+        return structured
+
+    def call_many(
+        self,
+        tool_name: str,
+        calls: List[Dict[str, Any]],
+        *,
+        timeout_sec: float,
+        max_wait_sec: float | None = None,
+        max_concurrent: int = 8,
+    ) -> Iterator[Tuple[int, Dict[str, Any] | None, str | None]]:
+        # Keep up to max_concurrent tools/call requests in flight and yield (index, structured, error)
+        # as each reply arrives; timeout_sec bounds the wait for the next reply, not the whole batch.
+        replies: queue.Queue[Dict[str, Any]] = queue.Queue()
+        pending: Dict[int, Tuple[int, float]] = {}
+        next_index = 0
+        try:
+            while next_index < len(calls) or pending:
+                while next_index < len(calls) and len(pending) < max(1, max_concurrent):
+                    request_id = self._send("tools/call", _tool_call_params(tool_name, calls[next_index]), replies)
+                    pending[request_id] = (next_index, time.time())
+                    next_index += 1
+                msg = self._next_message(replies, deadline=time.monotonic() + _wait_budget(timeout_sec, max_wait_sec), method="tools/call")
+                entry = pending.pop(msg.get("id"), None)  # type: ignore[arg-type]
+                if entry is None:
+                    continue
+                index, started = entry
+                structured, error = _structured_result(msg)
+                if structured is not None:
+                    structured["_elapsed_sec"] = structured["_call_elapsed_sec"] = round(time.time() - started, 3)
+                yield index, structured, error
+        finally:
+            self._forget(pending)
+
+    def _stderr_text(self) -> str:
+        # stdio is binary; stderr is only decoded when it ends up in an error message.
+        return b"".join(self._stderr_tail).decode("utf-8", errors="replace").strip()
+
+    def _read_stdout(self) -> None:
+        assert self._proc is not None and self._proc.stdout is not None
+        for line in self._proc.stdout:
+            # Parse the line as read (JSON allows the trailing newline): no stripped copy of big replies.
+            if line.isspace():
+                continue
+            # One regex match plus a dict pop answers "is anyone waiting for this?" however many ids are in flight.
+            m = _LEADING_ID_RE.match(line)
+            if m is not None:
+                request_id = int(m.group(1))
+                with self._lock:
+                    replies = self._waiters.pop(request_id, None)
+                if replies is None:
+                    continue  # e.g. its caller timed out: skip the parse
+                try:
+                    msg = _loads_json(line)
+                except ValueError:
+                    msg = {"id": request_id, "error": {"message": "unparseable reply from websearch_router"}}
+                replies.put(msg)
+                continue
+            try:
+                msg = _loads_json(line)
+            except ValueError:
+                continue
+            if not isinstance(msg, dict):
+                continue
+            with self._lock:
+                replies = self._waiters.pop(msg.get("id"), None)  # type: ignore[arg-type]
+            if replies is not None:
+                replies.put(msg)
+        # The router is gone: wake every waiter now instead of letting it run out its timeout.
+        with self._lock:
+            self._eof = True
+            waiters = list(self._waiters.values())
+            self._waiters.clear()
+        for replies in waiters:
+            replies.put(_EOF)
+
+    def _read_stderr(self) -> None:
+        assert self._proc is not None and self._proc.stderr is not None
+        for line in self._proc.stderr:
+            self._stderr_tail.append(line)
+
+    def _send(self, method: str, params_json: bytes, replies: queue.Queue[Dict[str, Any]]) -> int:
+        proc = self._proc
+        if proc is None or proc.stdin is None:
+            raise RuntimeError("websearch_router MCP session is not started")
+        with self._lock:
+            if self._eof:
+                raise SystemExit(self._exit_message())
+            request_id = self._next_id
+            self._next_id += 1
+            self._waiters[request_id] = replies
+            try:
+                proc.stdin.write(_frame_head(request_id, method))
+                proc.stdin.write(params_json)
+                proc.stdin.write(b"}\n")
+                proc.stdin.flush()
+                return request_id
+            except OSError:
+                # The router died under us (BrokenPipeError); report it like the EOF path does.
+                self._waiters.pop(request_id, None)
+                self._eof = True
+        raise SystemExit(self._exit_message())
+
+    def _forget(self, request_ids: Iterable[int]) -> None:
+        with self._lock:
+            for request_id in list(request_ids):
+                self._waiters.pop(request_id, None)
+
+    def _next_message(self, replies: queue.Queue[Dict[str, Any]], *, deadline: float, method: str) -> Dict[str, Any]:
+        try:
+            msg = replies.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            raise SystemExit(f"websearch_router MCP timed out waiting for {method}. stderr={self._stderr_text()}") from None
+        if msg is _EOF:
+            raise SystemExit(self._exit_message())
+        return msg
+
+    def _exit_message(self) -> str:
+        proc = self._proc
+        code = None
+        if proc is not None:
+            try:
+                code = proc.wait(timeout=1.0)
+            except subprocess.TimeoutExpired:
+                pass
+        if self._stderr_reader is not None:
+            self._stderr_reader.join(timeout=1.0)
+        return f"websearch_router MCP failed (code={code}): {self._stderr_text()}"
+
+    def _request(self, method: str, params_json: bytes, *, timeout_sec: float) -> Dict[str, Any]:
+        replies: queue.Queue[Dict[str, Any]] = queue.Queue(maxsize=1)
+        request_id = self._send(method, params_json, replies)
+        try:
+            return self._next_message(replies, deadline=time.monotonic() + timeout_sec, method=method)
+        finally:
+            self._forget([request_id])
 
+
+def _structured_result(resp: Dict[str, Any]) -> Tuple[Dict[str, Any] | None, str | None]:
+    if "error" in resp:
+        return None, json.dumps(resp["error"], ensure_ascii=False)
     result = resp.get("result") or {}
     structured = result.get("structuredContent")
     if not isinstance(structured, dict):
-        raise SystemExit(f"Bad tool result: {json.dumps(result, ensure_ascii=False)[:500]}")
+        return None, f"Bad tool result: {json.dumps(result, ensure_ascii=False)[:500]}"
+    return structured, None
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_session(repo_root: Path) -> WebsearchMCPSession:
+    session = WebsearchMCPSession(repo_root)
+    session.start()
+    atexit.register(session.close)
+    return session
+
+
+def _run_stdio_mcp_call(
+    repo_root: Path,
+    *,
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    timeout_sec: float,
+    max_wait_sec: float | None = None,
+) -> Dict[str, Any]:
+    # Repeated in-process calls share one router process instead of spawning one each.
+    # _elapsed_sec stays end-to-end (router start + initialize when the session is cold, as it always
+    # was); _call_elapsed_sec is the tools/call round trip alone.
+    started = time.time()
+    session = _shared_session(repo_root)
+    structured = session.call(tool_name, tool_args, timeout_sec=timeout_sec, max_wait_sec=max_wait_sec)
     structured["_elapsed_sec"] = round(time.time() - started, 3)
     return structured
 
 
+def _default_socket_path(repo_root: Path) -> Path:
+    # Short (AF_UNIX paths are capped at ~108 bytes, so never under the repo tree), in a per-user
+    # private directory, and per checkout so one repo's daemon never answers for another.
+    runtime_dir = (os.environ.get("XDG_RUNTIME_DIR") or "").strip()
+    base = Path(runtime_dir) if runtime_dir else Path(tempfile.gettempdir()) / f"websearch_client-{os.getuid()}"
+    tag = hashlib.blake2b(str(repo_root).encode("utf-8"), digest_size=6).hexdigest()
+    return base / f"websearch_client-{tag}.sock"
+
+
+def _dir_is_private(path: Path) -> bool:
+    # Owned by us (or root) and nobody else can swap entries in it (sticky dirs like /tmp are fine).
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if st.st_uid not in (os.getuid(), 0):
+        return False
+    return not (st.st_mode & 0o022) or bool(st.st_mode & stat.S_ISVTX)
+
+
+def _socket_is_ours(path: Path) -> bool:
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid() and _dir_is_private(path.parent)
+
+
+# Daemon wire format: 4-byte big-endian length, then one JSON document.
+def _send_msg(sock: socket.socket, obj: Any) -> None:
+    data = _dumps_json_bytes(obj)
+    sock.sendall(struct.pack(">I", len(data)))
+    sock.sendall(data)
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("connection closed mid-message")
+        buf += chunk
+    return bytes(buf)
+
+
+def _recv_msg(sock: socket.socket) -> Any:
+    (size,) = struct.unpack(">I", _recv_exact(sock, 4))
+    return _loads_json(_recv_exact(sock, size))
+
+
+_daemon_session_lock = threading.Lock()
+
+
+def _live_session(repo_root: Path) -> WebsearchMCPSession:
+    # The daemon outlives any one router process: replace the shared session if its router died.
+    with _daemon_session_lock:
+        session = _shared_session(repo_root)
+        if session.alive:
+            return session
+        _shared_session.cache_clear()
+        session.close()
+        return _shared_session(repo_root)
+
+
+class _DaemonHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        req = _recv_msg(self.request)
+        if req.get("repo_root") != str(self.server.repo_root):  # type: ignore[attr-defined]
+            # A client from another checkout: refuse before running anything against our state/.
+            _send_msg(self.request, {"error": f"daemon serves {self.server.repo_root}", "repo_mismatch": True})  # type: ignore[attr-defined]
+            return
+        try:
+            session = _live_session(self.server.repo_root)  # type: ignore[attr-defined]
+            structured = session.call(
+                req["tool_name"],
+                req["tool_args"],
+                timeout_sec=float(req["timeout_sec"]),
+                max_wait_sec=req.get("max_wait_sec"),
+            )
+            reply: Dict[str, Any] = {"structured": structured}
+        except (SystemExit, Exception) as e:  # router failures surface as SystemExit
+            reply = {"error": str(e)}
+        _send_msg(self.request, reply)
+
+
+class _DaemonServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        super().__init__(str(socket_path), _DaemonHandler)
+
+
+def _run_daemon(repo_root: Path, socket_path: Path) -> int:
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not _dir_is_private(socket_path.parent):
+        raise SystemExit(f"refusing to listen in {socket_path.parent}: not owned by this user or writable by others")
+    if os.path.lexists(socket_path):
+        if not _socket_is_ours(socket_path):
+            raise SystemExit(f"refusing to replace {socket_path}: not a socket owned by this user")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink(missing_ok=True)  # stale socket from a daemon that did not clean up
+        else:
+            raise SystemExit(f"websearch_client daemon already listening on {socket_path}")
+        finally:
+            probe.close()
+
+    server = _DaemonServer(socket_path, repo_root)
+    os.chmod(socket_path, 0o600)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))  # clean up the socket on a plain `kill` too
+    try:
+        _live_session(repo_root)  # start the router now so the first client does not pay for it
+        print(f"OK: websearch_client daemon listening on {socket_path}", file=sys.stderr, flush=True)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+    return 0
+
+
+def _daemon_call(
+    socket_path: Path,
+    repo_root: Path,
+    *,
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    timeout_sec: float,
+    max_wait_sec: float | None = None,
+) -> Dict[str, Any] | None:
+    # None means no usable daemon; the caller then starts its own router.
+    if not _socket_is_ours(socket_path):
+        return None  # absent, or someone else's socket: never send queries to it or trust its answers
+    started = time.time()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            # Not listening, stale, unreachable (permissions) or an unusable path: run locally.
+            return None
+        sock.settimeout(_wait_budget(timeout_sec, max_wait_sec) + 5.0)
+        try:
+            _send_msg(
+                sock,
+                {
+                    "repo_root": str(repo_root),
+                    "tool_name": tool_name,
+                    "tool_args": tool_args,
+                    "timeout_sec": timeout_sec,
+                    "max_wait_sec": max_wait_sec,
+                },
+            )
+            reply = _recv_msg(sock)
+        except OSError as e:
+            raise SystemExit(f"websearch_client daemon at {socket_path} failed: {e}") from None
+    finally:
+        sock.close()
+    if reply.get("repo_mismatch"):
+        return None
+    if reply.get("error") is not None:
+        raise SystemExit(str(reply["error"]))
+    structured = reply["structured"]
+    structured["_elapsed_sec"] = round(time.time() - started, 3)  # as seen by this client; the daemon's call time stays in _call_elapsed_sec
+    return structured
+
+
+def _tool_args(args: argparse.Namespace, overrides: Dict[str, Any]) -> Dict[str, Any]:
+    # Per-query fields (from --queries-file) override the CLI defaults.
+    opts = {
+        "query": args.query,
+        "max_results": args.max_results,
+        "min_results": args.min_results,
+        "language": args.language,
+        "recency": args.recency,
+        "domain_filter": args.domain_filter,
+        "allow_paid": args.allow_paid,
+        "timeout_sec": args.timeout_sec,
+        "use_cache": not bool(args.no_cache),
+    }
+    opts.update({k: v for k, v in overrides.items() if k in opts})
+    tool_args: Dict[str, Any] = {
+        "query": str(opts["query"]),
+        "max_results": int(opts["max_results"]),
+        "language": opts["language"],
+        "recency": opts["recency"],
+        "allow_paid": bool(opts["allow_paid"]),
+        "timeout_sec": float(opts["timeout_sec"]),
+        "use_cache": bool(opts["use_cache"]),
+    }
+    if opts["min_results"] is not None:
+        tool_args["min_results"] = int(opts["min_results"])
+    if opts["domain_filter"]:
+        tool_args["domain_filter"] = str(opts["domain_filter"])
+    return tool_args
+
+
+def _cache_key(tool_args: Dict[str, Any]) -> str:
+    # timeout_sec / use_cache change how the router works, not what it returns.
+    params = {k: v for k, v in tool_args.items() if k not in ("timeout_sec", "use_cache")}
+    blob = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_ttl_seconds() -> int:
+    # Same knob (and default) as the router's own per-provider cache.
+    try:
+        return int(os.environ.get("WEBSEARCH_ROUTER_CACHE_TTL_SECONDS") or 86400)
+    except ValueError:
+        return 86400
+
+
+_memory_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def _load_cached_result(cache_dir: Path, key: str) -> Dict[str, Any] | None:
+    hit = _memory_cache.get(key)
+    if hit is None:
+        path = cache_dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > _cache_ttl_seconds():
+                return None
+            hit = _loads_json(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(hit, dict):
+            return None
+        _memory_cache[key] = hit
+    return {**hit, "_cache_hit": True, "_elapsed_sec": 0.0, "_call_elapsed_sec": 0.0}
+
+
+def _store_cached_result(cache_dir: Path, key: str, structured: Dict[str, Any]) -> None:
+    # Only keep answers that found something; a provider outage should not be replayed for a day.
+    if not structured.get("results"):
+        return
+    data = {k: v for k, v in structured.items() if not k.startswith("_")}
+    _memory_cache[key] = data
+    try:
+        _atomic_write_text(cache_dir / f"{key}.json", _dumps_json_bytes(data).decode("utf-8"))
+    except OSError:
+        pass
+
+
+def _project_results(structured: Dict[str, Any], fields: List[str] | None) -> Dict[str, Any]:
+    # --fields: keep only the requested keys of each results[] entry (the bulk of the output).
+    if not fields or not isinstance(structured.get("results"), list):
+        return structured
+    results = [{f: r[f] for f in fields if f in r} for r in structured["results"] if isinstance(r, dict)]
+    return {**structured, "results": results}
+
+
+def _load_queries_file(path: Path) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+    for lineno, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip():
+            continue
+        obj = json.loads(line)
+        if not isinstance(obj, dict) or not str(obj.get("query") or "").strip():
+            raise SystemExit(f"{path}:{lineno}: expected a JSON object with a non-empty 'query'")
+        items.append(obj)
+    return items
+
+
+def _run_queries_file(repo_root: Path, args: argparse.Namespace, cache_dir: Path | None, fields: List[str] | None) -> int:
+    items = _load_queries_file(Path(args.queries_file))
+    # Identical queries collapse to one call; its result is fanned out to every line that asked for it.
+    unique_calls: List[Dict[str, Any]] = []
+    keys: List[str] = []
+    targets: List[List[int]] = []
+    seen: Dict[Tuple[str, bool], int] = {}
+    for index, item in enumerate(items):
+        tool_args = _tool_args(args, item)
+        key = _cache_key(tool_args)
+        dedupe_key = (key, bool(tool_args["use_cache"]))
+        if dedupe_key not in seen:
+            seen[dedupe_key] = len(unique_calls)
+            unique_calls.append(tool_args)
+            keys.append(key)
+            targets.append([])
+        targets[seen[dedupe_key]].append(index)
+
+    failed = 0
+
+    def _emit(call_index: int, structured: Dict[str, Any] | None, error: str | None) -> None:
+        nonlocal failed
+        for index in targets[call_index]:
+            if error is not None:
+                failed += 1
+                row: Dict[str, Any] = {"_index": index, "_error": error}
+            else:
+                row = {"_index": index, **_project_results(structured or {}, fields)}
+            _write_json_line(row)
+
+    misses: List[int] = []
+    for call_index, tool_args in enumerate(unique_calls):
+        cached = _load_cached_result(cache_dir, keys[call_index]) if cache_dir and tool_args["use_cache"] else None
+        if cached is not None:
+            _emit(call_index, cached, None)
+        else:
+            misses.append(call_index)
+    if not misses:
+        return 0
+
+    batch_started = time.time()
+    session = _shared_session(repo_root)
+    results = session.call_many(
+        "websearch_router_search",
+        [unique_calls[i] for i in misses],
+        timeout_sec=args.timeout_sec,
+        max_wait_sec=args.max_wait_sec,
+        max_concurrent=args.max_concurrent,
+    )
+    for miss_index, structured, error in results:
+        call_index = misses[miss_index]
+        if structured is not None:
+            # End-to-end for the batch: router start + initialize + queueing behind earlier calls.
+            structured["_elapsed_sec"] = round(time.time() - batch_started, 3)
+        if structured is not None and cache_dir and unique_calls[call_index]["use_cache"]:
+            _store_cached_result(cache_dir, keys[call_index], structured)
+        _emit(call_index, structured, error)
+    return 1 if failed else 0
+
+
 def main(argv: List[str]) -> int:
     parser = argparse.ArgumentParser(description="Call websearch_router_search via stdio and print structured JSON.")
-    parser.add_argument("--query", required=True)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--query")
+    target.add_argument(
+        "--queries-file",
+        default=None,
+        help="JSONL of {query, ...} objects; runs them over one router session and prints one JSON line per query as results arrive.",
+    )
+    target.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep one router running behind a Unix socket; later --query runs use it instead of starting their own.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Daemon socket path (default: websearch_client-<repo hash>.sock in $XDG_RUNTIME_DIR, else in a private <tmpdir>/websearch_client-<uid>/).",
+    )
+    parser.add_argument("--max-concurrent", type=int, default=8, help="Max in-flight tool calls with --queries-file (default: 8).")
     parser.add_argument("--max-results", type=int, default=5)
     parser.add_argument("--min-results", type=int, default=None)
     parser.add_argument("--language", default="auto", choices=["auto", "en", "zh-hans", "zh-hant"])
@@ -81,29 +782,61 @@ def main(argv: List[str]) -> int:
     parser.add_argument("--domain-filter", default=None)
     parser.add_argument("--allow-paid", action="store_true")
     parser.add_argument("--timeout-sec", type=float, default=30.0)
+    parser.add_argument(
+        "--max-wait-sec",
+        type=float,
+        default=None,
+        help="Hard cap on waiting for one router reply (default: timeout-sec + 30, room for provider fallbacks).",
+    )
     parser.add_argument("--no-cache", action="store_true", help="Disable cache for this request.")
+    parser.add_argument(
+        "--cache-dir",
+        default="state/tmp/websearch_client_cache",
+        help="Client-side result cache (relative to the repo root); a hit skips starting the router at all.",
+    )
+    parser.add_argument(
+        "--fields",
+        default=None,
+        help="Comma-separated keys to keep in each results[] entry (e.g. url,title,snippet); default keeps all.",
+    )
     args = parser.parse_args(argv)
 
     repo_root = _repo_root()
-    tool_args: Dict[str, Any] = {
-        "query": args.query,
-        "max_results": int(args.max_results),
-        "language": args.language,
-        "recency": args.recency,
-        "allow_paid": bool(args.allow_paid),
-        "timeout_sec": float(args.timeout_sec),
-        "use_cache": not bool(args.no_cache),
-    }
-    if args.min_results is not None:
-        tool_args["min_results"] = int(args.min_results)
-    if args.domain_filter:
-        tool_args["domain_filter"] = str(args.domain_filter)
+    cache_dir = None if args.no_cache else repo_root / args.cache_dir
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()] if args.fields else None
+    socket_path = Path(args.socket) if args.socket else _default_socket_path(repo_root)
+    if args.daemon:
+        return _run_daemon(repo_root, socket_path)
+    if args.queries_file:
+        return _run_queries_file(repo_root, args, cache_dir, fields)
 
-    structured = _run_stdio_mcp_call(repo_root, tool_name="websearch_router_search", tool_args=tool_args, timeout_sec=args.timeout_sec)
-    sys.stdout.write(json.dumps(structured, ensure_ascii=False) + "\n")
+    tool_args = _tool_args(args, {})
+    key = _cache_key(tool_args)
+    cached = _load_cached_result(cache_dir, key) if cache_dir else None
+    if cached is not None:
+        _write_json_line(_project_results(cached, fields))
+        return 0
+    structured = _daemon_call(
+        socket_path,
+        repo_root,
+        tool_name="websearch_router_search",
+        tool_args=tool_args,
+        timeout_sec=args.timeout_sec,
+        max_wait_sec=args.max_wait_sec,
+    )
+    if structured is None:
+        structured = _run_stdio_mcp_call(
+            repo_root,
+            tool_name="websearch_router_search",
+            tool_args=tool_args,
+            timeout_sec=args.timeout_sec,
+            max_wait_sec=args.max_wait_sec,
+        )
+    if cache_dir:
+        _store_cached_result(cache_dir, key, structured)
+    _write_json_line(_project_results(structured, fields))
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main(sys.argv[1:]))
-